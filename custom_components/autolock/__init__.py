@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
-from .door import AutolockDoor
+from .door import AutolockDoor, AutolockRegistry
+from .helpers import clear_created_cache
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,7 +18,7 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the AutoLock integration."""
-    hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, AutolockRegistry())
     return True
 
 
@@ -27,17 +29,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create door instance
     door_id = entry.unique_id or entry.entry_id
     door = AutolockDoor(hass, door_id, entry.data)
+    registry: AutolockRegistry = hass.data[DOMAIN]
 
-    # Set up door
-    await door.async_setup()
+    # Set up door and services (only once) concurrently
+    if not registry.services_setup:
+        await asyncio.gather(door.async_setup(), async_setup_services(hass))
+        registry.services_setup = True
+    else:
+        await door.async_setup()
 
     # Store door instance
-    hass.data[DOMAIN][door_id] = door
-
-    # Set up services (only once)
-    if DOMAIN not in hass.data.get("_autolock_services_setup", set()):
-        await async_setup_services(hass)
-        hass.data.setdefault("_autolock_services_setup", set()).add(DOMAIN)
+    registry.doors[door_id] = door
 
     _LOGGER.info("AutoLock entry setup complete: %s", entry.title)
     return True
@@ -48,11 +50,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading AutoLock entry: %s", entry.title)
 
     door_id = entry.unique_id or entry.entry_id
-    door = hass.data[DOMAIN].get(door_id)
+    registry: AutolockRegistry = hass.data[DOMAIN]
+    door = registry.doors.pop(door_id, None)
 
     if door:
         await door.async_unload()
-        del hass.data[DOMAIN][door_id]
+
+    # Helpers may be removed while unloaded; check them again on next setup
+    clear_created_cache()
 
     _LOGGER.info("AutoLock entry unloaded: %s", entry.title)
     return True
@@ -3,20 +3,33 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_DAY_DELAY,
+    DEFAULT_NIGHT_DELAY,
+    DEFAULT_RETRY_COUNT,
+    DEFAULT_RETRY_DELAY,
+    DOMAIN,
+)
 from .validation import (
+    DAY_DELAY_VALIDATOR,
+    NIGHT_DELAY_VALIDATOR,
+    RETRY_COUNT_VALIDATOR,
+    RETRY_DELAY_VALIDATOR,
     SCHEMA_BASE,
     SCHEMA_OPTIONS,
     SCHEMA_RETRY,
     SCHEMA_SENSOR,
     SCHEMA_TIMING,
+    validate_full_config,
     validate_lock_entity,
     validate_schedule,
     validate_sensor_entity,
@@ -24,6 +37,69 @@ from .validation import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options flow validators, reused with per-entry defaults
+_OPTIONS_VALIDATORS: dict[str, tuple[int, vol.All]] = {
+    "day_delay": (DEFAULT_DAY_DELAY, DAY_DELAY_VALIDATOR),
+    "night_delay": (DEFAULT_NIGHT_DELAY, NIGHT_DELAY_VALIDATOR),
+    "retry_count": (DEFAULT_RETRY_COUNT, RETRY_COUNT_VALIDATOR),
+    "retry_delay": (DEFAULT_RETRY_DELAY, RETRY_DELAY_VALIDATOR),
+}
+
+
+@lru_cache(maxsize=32)
+def _options_schema(*current: Any) -> vol.Schema:
+    """Build the options form schema, shared by entries with the same values.
+
+    Args:
+        current: Current value for each key of _OPTIONS_VALIDATORS, in order
+
+    Returns:
+        Schema with the current values as defaults
+    """
+    return vol.Schema(
+        {
+            vol.Required(key, default=value): validator
+            for value, (key, (_, validator)) in zip(
+                current, _OPTIONS_VALIDATORS.items(), strict=True
+            )
+        }
+    )
+
+
+def _validate_user(hass: HomeAssistant, user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate the user step (lock entity)."""
+    if not validate_lock_entity(hass, user_input["lock_entity"]):
+        return {"lock_entity": "invalid_lock_entity"}
+    return {}
+
+
+def _validate_sensor(hass: HomeAssistant, user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate the sensor step (optional sensor entity)."""
+    sensor_entity = user_input.get("sensor_entity")
+    if sensor_entity and not validate_sensor_entity(hass, sensor_entity):
+        return {"sensor_entity": "invalid_sensor_entity"}
+    return {}
+
+
+def _validate_timing(hass: HomeAssistant, user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate the timing step (night schedule)."""
+    if not validate_schedule(user_input["night_start"], user_input["night_end"]):
+        return {"night_start": "invalid_schedule"}
+    return {}
+
+
+_StepValidator = Callable[[HomeAssistant, dict[str, Any]], dict[str, str]]
+
+# Config flow steps: step_id -> (schema, validator, next step_id)
+# A step without a next step creates the config entry.
+_STEPS: dict[str, tuple[vol.Schema, _StepValidator | None, str | None]] = {
+    "user": (SCHEMA_BASE, _validate_user, "sensor"),
+    "sensor": (SCHEMA_SENSOR, _validate_sensor, "timing"),
+    "timing": (SCHEMA_TIMING, _validate_timing, "retry"),
+    "retry": (SCHEMA_RETRY, None, "options"),
+    "options": (SCHEMA_OPTIONS, None, None),
+}
+
 
 class AutoLockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for AutoLock."""
@@ -34,109 +110,77 @@ class AutoLockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ign
         """Initialize config flow."""
         self.data: dict[str, Any] = {}
 
-    async def async_step_user(
+    async def _async_step(
         self,
+        step_id: str,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Run a step from the step table."""
+        schema, validate, next_step_id = _STEPS[step_id]
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate lock entity
-            if not validate_lock_entity(self.hass, user_input["lock_entity"]):
-                errors["lock_entity"] = "invalid_lock_entity"
-            else:
+            if validate is not None:
+                errors = validate(self.hass, user_input)
+            if not errors:
                 self.data.update(user_input)
-                return await self.async_step_sensor()
+                if next_step_id is None:
+                    return await self._async_create_door_entry()
+                return await self._async_step(next_step_id)
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=SCHEMA_BASE,
+            step_id=step_id,
+            data_schema=schema,
             errors=errors,
         )
 
+    async def _async_create_door_entry(self) -> FlowResult:
+        """Create the config entry from the collected data."""
+        # Generate unique ID
+        unique_id = f"{self.data['lock_entity']}"
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        # Create config entry
+        return self.async_create_entry(
+            title=self.data["name"],
+            data=self.data,
+        )
+
+    async def async_step_user(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> FlowResult:
+        """Handle the initial step."""
+        return await self._async_step("user", user_input)
+
     async def async_step_sensor(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle sensor step (optional)."""
-        if user_input is not None:
-            sensor_entity = user_input.get("sensor_entity")
-            if sensor_entity and not validate_sensor_entity(self.hass, sensor_entity):
-                return self.async_show_form(
-                    step_id="sensor",
-                    data_schema=SCHEMA_SENSOR,
-                    errors={"sensor_entity": "invalid_sensor_entity"},
-                )
-            self.data.update(user_input)
-            return await self.async_step_timing()
-
-        return self.async_show_form(
-            step_id="sensor",
-            data_schema=SCHEMA_SENSOR,
-        )
+        return await self._async_step("sensor", user_input)
 
     async def async_step_timing(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle timing step."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            # Validate schedule
-            if not validate_schedule(
-                user_input["night_start"],
-                user_input["night_end"],
-            ):
-                errors["night_start"] = "invalid_schedule"
-            else:
-                self.data.update(user_input)
-                return await self.async_step_retry()
-
-        return self.async_show_form(
-            step_id="timing",
-            data_schema=SCHEMA_TIMING,
-            errors=errors,
-        )
+        return await self._async_step("timing", user_input)
 
     async def async_step_retry(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle retry settings step."""
-        if user_input is not None:
-            self.data.update(user_input)
-            return await self.async_step_options()
-
-        return self.async_show_form(
-            step_id="retry",
-            data_schema=SCHEMA_RETRY,
-        )
+        return await self._async_step("retry", user_input)
 
     async def async_step_options(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle options step."""
-        if user_input is not None:
-            self.data.update(user_input)
-
-            # Generate unique ID
-            unique_id = f"{self.data['lock_entity']}"
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
-
-            # Create config entry
-            return self.async_create_entry(
-                title=self.data["name"],
-                data=self.data,
-            )
-
-        return self.async_show_form(
-            step_id="options",
-            data_schema=SCHEMA_OPTIONS,
-        )
+        return await self._async_step("options", user_input)
 
     @staticmethod
     @callback
@@ -159,48 +203,31 @@ class AutoLockOptionsFlowHandler(config_entries.OptionsFlow):
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle options flow."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            # Update config entry
-            self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                data={**self.config_entry.data, **user_input},
-            )
-            return self.async_create_entry(title="", data={})
+            # Revalidate the merged entry data in one pass before saving
+            try:
+                data = validate_full_config({**self.config_entry.data, **user_input})
+            except vol.Invalid as err:
+                _LOGGER.error("Invalid AutoLock configuration: %s", err)
+                errors["base"] = "invalid_config"
+            else:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data=data,
+                )
+                return self.async_create_entry(title="", data={})
 
         # Show current values
         current_data = self.config_entry.data
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        "day_delay",
-                        default=current_data.get("day_delay", 5),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=1, max=240),
-                    ),
-                    vol.Required(
-                        "night_delay",
-                        default=current_data.get("night_delay", 2),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=1, max=30),
-                    ),
-                    vol.Required(
-                        "retry_count",
-                        default=current_data.get("retry_count", 3),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=0, max=5),
-                    ),
-                    vol.Required(
-                        "retry_delay",
-                        default=current_data.get("retry_delay", 5),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=3, max=60),
-                    ),
-                }
+            data_schema=_options_schema(
+                *(
+                    current_data.get(key, default)
+                    for key, (default, _) in _OPTIONS_VALIDATORS.items()
+                )
             ),
+            errors=errors,
         )
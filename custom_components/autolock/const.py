@@ -7,12 +7,32 @@ from typing import Final
 # Domain
 DOMAIN: Final = "autolock"
 
-# Entity ID templates
-AUTOLOCK_ENABLED_TEMPLATE: Final = "input_boolean.autolock_{door_id}_enabled"
-AUTOLOCK_SNOOZE_TEMPLATE: Final = "input_datetime.autolock_{door_id}_snooze_until"
-AUTOLOCK_TIMER_TEMPLATE: Final = "timer.autolock_{door_id}_delay"
-AUTOLOCK_SCRIPT_TEMPLATE: Final = "script.autolock_{door_id}_lock"
-AUTOLOCK_AUTOMATION_TEMPLATE: Final = "automation.autolock_{door_id}"
+
+# Entity ID builders
+def autolock_enabled_entity(door_id: str) -> str:
+    """Return the enabled helper entity ID for a door."""
+    return f"input_boolean.autolock_{door_id}_enabled"
+
+
+def autolock_snooze_entity(door_id: str) -> str:
+    """Return the snooze helper entity ID for a door."""
+    return f"input_datetime.autolock_{door_id}_snooze_until"
+
+
+def autolock_timer_entity(door_id: str) -> str:
+    """Return the delay timer entity ID for a door."""
+    return f"timer.autolock_{door_id}_delay"
+
+
+def autolock_script_entity(door_id: str) -> str:
+    """Return the lock script entity ID for a door."""
+    return f"script.autolock_{door_id}_lock"
+
+
+def autolock_automation_entity(door_id: str) -> str:
+    """Return the automation entity ID for a door."""
+    return f"automation.autolock_{door_id}"
+
 
 # Default values
 DEFAULT_DAY_DELAY: Final = 5  # minutes
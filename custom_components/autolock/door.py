@@ -7,31 +7,81 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
-from typing import Any
-
-from homeassistant.core import Event, HomeAssistant, callback
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    AUTOLOCK_AUTOMATION_TEMPLATE,
-    AUTOLOCK_ENABLED_TEMPLATE,
-    AUTOLOCK_SCRIPT_TEMPLATE,
-    AUTOLOCK_SNOOZE_TEMPLATE,
-    AUTOLOCK_TIMER_TEMPLATE,
     LOCK_STATE_UNLOCKED,
+    MAX_RETRY_DELAY,
+    autolock_automation_entity,
+    autolock_enabled_entity,
+    autolock_script_entity,
+    autolock_snooze_entity,
+    autolock_timer_entity,
 )
 from .helpers import (
-    EntityFactory,
     NotificationService,
     RetryStrategy,
     ScheduleCalculator,
+    entity_factory,
 )
 from .helpers.schedule import ScheduleConfig
 from .safety import LockResult, SafetyValidator
 from .triggers import create_trigger_strategy
 
+if TYPE_CHECKING:
+    from homeassistant.components.timer import Timer
+
 _LOGGER = logging.getLogger(__name__)
 
+# Trigger entities in these domains fire on "on" (door closed)
+_SENSOR_DOMAINS: Final = frozenset({"sensor", "binary_sensor"})
+
+# Snooze helper states that mean no snooze is set
+_INACTIVE_SNOOZE: Final = frozenset({"unknown", "unavailable", ""})
+
+
+@lru_cache(maxsize=1440)
+def _delay_for_minute(
+    hour: int,
+    minute: int,
+    day_delay: int,
+    night_delay: int,
+    schedule: ScheduleConfig,
+) -> int:
+    """Get the delay for a minute of the day.
+
+    The day/night decision only changes at minute boundaries of the
+    schedule, so results are cached per (minute, delays, schedule).
+    """
+    return ScheduleCalculator.get_delay(
+        datetime.combine(datetime.min, time(hour, minute)),
+        day_delay,
+        night_delay,
+        schedule,
+    )
+
+
+@dataclass
+class AutolockRegistry:
+    """Domain data stored in hass.data[DOMAIN]."""
+
+    doors: dict[str, AutolockDoor] = field(default_factory=dict)
+    services_setup: bool = False
+
 
 class AutolockDoor:
     """Manages auto-lock functionality for a single door."""
@@ -53,110 +103,153 @@ class AutolockDoor:
         self.door_id = door_id
         self.config = config
 
+        # Settings read on every trigger/lock attempt
+        self._name: str = config["name"]
+        self.lock_entity: str = config["lock_entity"]
+        self.sensor_entity: str | None = config.get("sensor_entity")
+        self.day_delay: int = config["day_delay"]
+        self.night_delay: int = config["night_delay"]
+        self.retry_count: int = config.get("retry_count", 3)
+        self.retry_delay: float = config.get("retry_delay", 5.0)
+        self.verification_delay: float = config.get("verification_delay", 5.0)
+
+        # Timer service durations for the two possible delays
+        self._durations = {
+            delay: f"00:{delay:02d}:00" for delay in (self.day_delay, self.night_delay)
+        }
+
         # Components
         self.schedule_calculator = ScheduleCalculator()
         self.retry_strategy = RetryStrategy(logger=_LOGGER)
         self.notification_service = NotificationService(hass)
         self.safety_validator = SafetyValidator(hass)
-        self.entity_factory = EntityFactory()
-
-        # Entity IDs
-        self.enabled_entity = AUTOLOCK_ENABLED_TEMPLATE.format(door_id=door_id)
-        self.snooze_entity = AUTOLOCK_SNOOZE_TEMPLATE.format(door_id=door_id)
-        self.timer_entity = AUTOLOCK_TIMER_TEMPLATE.format(door_id=door_id)
-        self.script_entity = AUTOLOCK_SCRIPT_TEMPLATE.format(door_id=door_id)
-        self.automation_entity = AUTOLOCK_AUTOMATION_TEMPLATE.format(door_id=door_id)
-
-        # Schedule config
-        self.schedule_config = ScheduleConfig.from_strings(
-            config["night_start"],
-            config["night_end"],
-        )
 
         # Event listeners
-        self._listeners: list[Callable[[], None]] = []
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._lock_task: asyncio.Task[None] | None = None
+        self._unload_event = asyncio.Event()
+        self._expected: dict[str, str] = {}
+
+        # Timer entity object, resolved once the timer component has it
+        self._timer: Timer | None = None
+
+        # Last parsed snooze state (raw state string, parsed datetime)
+        self._snooze_cache: tuple[str, datetime] | None = None
+
+    @cached_property
+    def enabled_entity(self) -> str:
+        """Enabled helper entity ID."""
+        return autolock_enabled_entity(self.door_id)
+
+    @cached_property
+    def snooze_entity(self) -> str:
+        """Snooze helper entity ID."""
+        return autolock_snooze_entity(self.door_id)
+
+    @cached_property
+    def timer_entity(self) -> str:
+        """Delay timer entity ID."""
+        return autolock_timer_entity(self.door_id)
+
+    @cached_property
+    def script_entity(self) -> str:
+        """Lock script entity ID."""
+        return autolock_script_entity(self.door_id)
+
+    @cached_property
+    def automation_entity(self) -> str:
+        """Automation entity ID."""
+        return autolock_automation_entity(self.door_id)
+
+    @cached_property
+    def schedule_config(self) -> ScheduleConfig:
+        """Night schedule parsed from the door configuration."""
+        return ScheduleConfig.from_strings(
+            self.config["night_start"],
+            self.config["night_end"],
+        )
 
     async def async_setup(self) -> None:
         """Set up door instance (create entities, register listeners)."""
-        _LOGGER.info("Setting up door: %s", self.config["name"])
+        _LOGGER.info("Setting up door: %s", self._name)
 
         # Create helper entities
         await self._create_entities()
+        self._resolve_timer()
 
         # Register event listeners
         self._register_listeners()
 
-        _LOGGER.info("Door setup complete: %s", self.config["name"])
+        _LOGGER.info("Door setup complete: %s", self._name)
 
     async def _create_entities(self) -> None:
-        """Create helper entities."""
-        # Create enabled helper
-        await self.entity_factory.create_input_boolean(
-            self.hass,
-            self.enabled_entity,
-            f"{self.config['name']} AutoLock Enabled",
-            initial_state=self.config.get("enable_on_creation", True),
-        )
-
-        # Create snooze helper
-        await self.entity_factory.create_input_datetime(
-            self.hass,
-            self.snooze_entity,
-            f"{self.config['name']} AutoLock Snooze",
-            has_date=False,
-            has_time=True,
-        )
+        """Create helper entities.
 
-        # Create timer
-        await self.entity_factory.create_timer(
-            self.hass,
-            self.timer_entity,
-            f"{self.config['name']} AutoLock Delay",
+        The helpers are independent of each other, so their creation calls
+        are awaited concurrently.
+        """
+        await asyncio.gather(
+            # Create enabled helper
+            entity_factory.create_input_boolean(
+                self.hass,
+                self.enabled_entity,
+                f"{self._name} AutoLock Enabled",
+                initial_state=self.config.get("enable_on_creation", True),
+            ),
+            # Create snooze helper
+            entity_factory.create_input_datetime(
+                self.hass,
+                self.snooze_entity,
+                f"{self._name} AutoLock Snooze",
+                has_date=False,
+                has_time=True,
+            ),
+            # Create timer
+            entity_factory.create_timer(
+                self.hass,
+                self.timer_entity,
+                f"{self._name} AutoLock Delay",
+            ),
         )
 
     def _register_listeners(self) -> None:
         """Register event listeners for state changes."""
         # Listen to trigger entity state changes
         trigger_strategy = create_trigger_strategy(
-            self.hass,
-            self.config["lock_entity"],
-            self.config.get("sensor_entity"),
+            self.lock_entity,
+            self.sensor_entity,
         )
 
-        # Get trigger entities
+        # Get trigger entities and precompute their trigger states
+        # (door closed or lock unlocked)
         triggers = trigger_strategy.get_triggers()
-        for trigger in triggers:
-            entity_id = trigger.get("entity_id")
-            if entity_id:
-                self._listen_to_state_changes(entity_id)
+        entity_ids = [t["entity_id"] for t in triggers if t.get("entity_id")]
+        self._expected = {
+            entity_id: (
+                "on"
+                if entity_id.partition(".")[0] in _SENSOR_DOMAINS
+                else LOCK_STATE_UNLOCKED
+            )
+            for entity_id in entity_ids
+        }
+
+        # One subscription for all trigger entities of this door
+        if entity_ids:
+            self._listeners.append(
+                async_track_state_change_event(
+                    self.hass, entity_ids, self._on_trigger_state
+                )
+            )
 
         # Listen to timer finished events
         self._listen_to_timer_finished()
 
     @callback
-    def _listen_to_state_changes(self, entity_id: str) -> None:
-        """Listen to state changes for trigger entity."""
-
-        @callback
-        def state_changed_listener(event: Event) -> None:
-            """Handle state change event."""
-            if event.data.get("entity_id") != entity_id:
-                return
-
-            new_state = event.data.get("new_state")
-            if not new_state:
-                return
-
-            # Check if this is a trigger event (door closed or lock unlocked)
-            trigger_state = (
-                "on" if "sensor" in entity_id.lower() else LOCK_STATE_UNLOCKED
-            )
-            if new_state.state == trigger_state:
-                self.hass.async_create_task(self._handle_trigger())
-
-        self._listeners.append(
-            self.hass.bus.async_listen("state_changed", state_changed_listener)
-        )
+    def _on_trigger_state(self, event: Event[EventStateChangedData]) -> None:
+        """Handle state change event for a trigger entity."""
+        new_state = event.data["new_state"]
+        if new_state and new_state.state == self._expected.get(event.data["entity_id"]):
+            self.hass.async_create_task(self._handle_trigger())
 
     @callback
     def _listen_to_timer_finished(self) -> None:
@@ -166,7 +259,9 @@ class AutolockDoor:
         def timer_finished_listener(event: Event) -> None:
             """Handle timer finished event."""
             if event.data.get("entity_id") == self.timer_entity:
-                self.hass.async_create_task(self._handle_timer_finished())
+                self._lock_task = self.hass.async_create_task(
+                    self._handle_timer_finished()
+                )
 
         self._listeners.append(
             self.hass.bus.async_listen("timer.finished", timer_finished_listener)
@@ -174,107 +269,138 @@ class AutolockDoor:
 
     async def _handle_trigger(self) -> None:
         """Handle trigger event (door closed or lock unlocked)."""
-        _LOGGER.debug("Trigger event for door: %s", self.config["name"])
+        _LOGGER.debug("Trigger event for door: %s", self._name)
 
         # Check if enabled
         enabled_state = self.hass.states.get(self.enabled_entity)
         if not enabled_state or enabled_state.state != "on":
-            _LOGGER.debug("Door %s is disabled", self.config["name"])
+            _LOGGER.debug("Door %s is disabled", self._name)
             return
 
         # Check if snoozed
         snooze_state = self.hass.states.get(self.snooze_entity)
-        if snooze_state and snooze_state.state not in ("unknown", "unavailable"):
+        if snooze_state is not None and snooze_state.state not in _INACTIVE_SNOOZE:
             # Check if snooze time is in the future
-            from datetime import datetime
-
             try:
-                snooze_time = datetime.fromisoformat(snooze_state.state)
-                if snooze_time > datetime.now(snooze_time.tzinfo):
-                    _LOGGER.debug("Door %s is snoozed", self.config["name"])
+                snooze_time = self._parse_snooze(snooze_state.state)
+                if snooze_time > dt_util.now():
+                    _LOGGER.debug("Door %s is snoozed", self._name)
                     return
             except (ValueError, AttributeError):
                 pass
 
-        # Cancel existing timer
-        await self.hass.services.async_call(
-            "timer",
-            "cancel",
-            {"entity_id": self.timer_entity},
-        )
-
         # Calculate delay
-        from datetime import datetime
-
-        now = datetime.now()
-        delay_minutes = self.schedule_calculator.get_delay(
-            now,
-            self.config["day_delay"],
-            self.config["night_delay"],
+        now = dt_util.now()
+        delay_minutes = _delay_for_minute(
+            now.hour,
+            now.minute,
+            self.day_delay,
+            self.night_delay,
             self.schedule_config,
         )
 
-        # Start timer
-        delay_minutes * 60
-        await self.hass.services.async_call(
-            "timer",
-            "start",
-            {
-                "entity_id": self.timer_entity,
-                "duration": f"00:{delay_minutes:02d}:00",
-            },
-        )
+        # Restart timer, directly on the entity when available
+        timer = self._resolve_timer()
+        if timer is not None:
+            timer.async_cancel()
+            timer.async_start(timedelta(minutes=delay_minutes))
+        else:
+            await self.hass.services.async_call(
+                "timer",
+                "cancel",
+                {"entity_id": self.timer_entity},
+            )
+            await self.hass.services.async_call(
+                "timer",
+                "start",
+                {
+                    "entity_id": self.timer_entity,
+                    "duration": self._durations[delay_minutes],
+                },
+            )
 
         _LOGGER.info(
             "Started %d minute delay timer for door: %s",
             delay_minutes,
-            self.config["name"],
+            self._name,
         )
 
+    def _resolve_timer(self) -> Timer | None:
+        """Get the timer entity object from the timer component.
+
+        Returns:
+            Timer entity, or None if the timer component does not know it yet
+        """
+        if self._timer is None:
+            component = self.hass.data.get(DATA_INSTANCES, {}).get("timer")
+            if component is not None:
+                self._timer = component.get_entity(self.timer_entity)
+        return self._timer
+
+    def _parse_snooze(self, value: str) -> datetime:
+        """Parse snooze state, reusing the last result while it is unchanged."""
+        if self._snooze_cache is not None and self._snooze_cache[0] == value:
+            return self._snooze_cache[1]
+
+        snooze_time = dt_util.parse_datetime(value)
+        if snooze_time is None:
+            raise ValueError(f"Invalid snooze time: {value}")
+        # input_datetime stores naive HA-local time, not host-local time
+        if snooze_time.tzinfo is None:
+            snooze_time = snooze_time.replace(tzinfo=dt_util.get_default_time_zone())
+        self._snooze_cache = (value, snooze_time)
+        return snooze_time
+
     async def _handle_timer_finished(self) -> None:
         """Handle timer finished event."""
-        _LOGGER.info("Timer finished for door: %s", self.config["name"])
+        _LOGGER.info("Timer finished for door: %s", self._name)
 
         # Attempt to lock
         await self._lock_door()
 
     async def _lock_door(self) -> None:
         """Lock the door with retry logic."""
-        lock_entity = self.config["lock_entity"]
-        sensor_entity = self.config.get("sensor_entity")
+        lock_entity = self.lock_entity
 
         # Attempt lock with retry logic
         last_lock_result: LockResult | None = None
-        retry_count = self.config.get("retry_count", 3)
+        retry_count = self.retry_count
 
         for attempt in range(retry_count + 1):
             lock_result = await self.safety_validator.lock_with_verification(
                 lock_entity,
-                verification_delay=self.config.get("verification_delay", 5.0),
-                sensor_entity=sensor_entity,
+                verification_delay=self.verification_delay,
+                sensor_entity=self.sensor_entity,
             )
 
             if lock_result.success and lock_result.verified:
                 _LOGGER.info(
                     "Lock successful for door %s (attempt %d)",
-                    self.config["name"],
+                    self._name,
                     attempt + 1,
                 )
                 return
 
             last_lock_result = lock_result
 
-            # If not last attempt, wait before retry
+            # If not last attempt, back off before retry (abort on unload)
             if attempt < retry_count:
-                retry_delay = self.config.get("retry_delay", 5.0)
-                _LOGGER.warning(
-                    "Lock failed for door %s (attempt %d/%d), retrying in %.1f seconds",
-                    self.config["name"],
-                    attempt + 1,
-                    retry_count + 1,
-                    retry_delay,
+                retry_delay = min(
+                    self.retry_delay * (1 << attempt),
+                    MAX_RETRY_DELAY,
                 )
-                await asyncio.sleep(retry_delay)
+                if _LOGGER.isEnabledFor(logging.WARNING):
+                    _LOGGER.warning(
+                        "Lock failed for door %s (attempt %d/%d), "
+                        "retrying in %.1f seconds",
+                        self._name,
+                        attempt + 1,
+                        retry_count + 1,
+                        retry_delay,
+                    )
+                if await self._wait_for_unload(retry_delay):
+                    _LOGGER.debug("Door %s unloaded, aborting lock retries", self._name)
+                    return
 
         # All retries failed
         error_msg = (
@@ -288,19 +414,42 @@ class AutolockDoor:
             "Check lock integration status."
         )
         await self.notification_service.send_notification(
-            title=f"AutoLock Failed: {self.config['name']}",
+            title=f"AutoLock Failed: {self._name}",
             message=message,
             persistent_id=f"autolock_{self.door_id}_failure",
             severity="error",
         )
 
+    async def _wait_for_unload(self, timeout: float) -> bool:
+        """Wait until the door is unloaded or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the door was unloaded, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._unload_event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
     async def async_unload(self) -> None:
         """Unload door instance (remove listeners)."""
-        _LOGGER.info("Unloading door: %s", self.config["name"])
+        _LOGGER.info("Unloading door: %s", self._name)
+
+        self._unload_event.set()
 
         # Remove listeners
         for remove_listener in self._listeners:
             remove_listener()
         self._listeners.clear()
+        self.notification_service.async_unload()
+
+        # Abort in-flight lock attempts instead of waiting for their retries
+        if self._lock_task is not None and not self._lock_task.done():
+            self._lock_task.cancel()
+        self._lock_task = None
 
-        _LOGGER.info("Door unloaded: %s", self.config["name"])
+        _LOGGER.info("Door unloaded: %s", self._name)
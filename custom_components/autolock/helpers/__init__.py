@@ -6,8 +6,18 @@ or extracted to a shared core integration library.
 
 from __future__ import annotations
 
-from .entity_factory import EntityFactory
+from .entity_factory import (
+    clear_created_cache,
+    create_automation_yaml,
+    create_input_boolean,
+    create_input_datetime,
+    create_script_yaml,
+    create_timer,
+    generate_entity_id,
+)
 from .entity_validation import (
+    check_available,
+    check_state,
     validate_entity_available,
     validate_entity_domain,
     validate_entity_exists,
@@ -18,11 +28,19 @@ from .retry import RetryResult, RetryStrategy
 from .schedule import ScheduleCalculator
 
 __all__ = [
-    "EntityFactory",
     "NotificationService",
     "RetryResult",
     "RetryStrategy",
     "ScheduleCalculator",
+    "check_available",
+    "check_state",
+    "clear_created_cache",
+    "create_automation_yaml",
+    "create_input_boolean",
+    "create_input_datetime",
+    "create_script_yaml",
+    "create_timer",
+    "generate_entity_id",
     "validate_entity_available",
     "validate_entity_domain",
     "validate_entity_exists",
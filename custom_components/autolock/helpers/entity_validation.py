@@ -2,16 +2,29 @@
 
 This module provides reusable entity validation functions that can be used
 by any integration needing to validate entities (domain-agnostic).
+
+The public validate_* functions are convenience wrappers that look the entity
+up in the state machine on every call. Callers running several checks against
+the same entity should fetch its State once and use the state-accepting
+variants (check_state, check_available) instead.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Collection
+from functools import lru_cache
+from typing import Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 
 _LOGGER = logging.getLogger(__name__)
 
+# States that mean an entity is not available
+_UNAVAILABLE_STATES: Final[frozenset[str]] = frozenset(
+    {"unavailable", "unknown", "None"}
+)
+
 
 def validate_entity_exists(hass: HomeAssistant, entity_id: str) -> bool:
     """Validate that an entity exists.
@@ -50,11 +63,8 @@ def validate_entity_domain(
     Returns:
         True if entity belongs to domain, False otherwise
     """
-    if not validate_entity_exists(hass, entity_id):
-        return False
-
-    # Extract domain from entity_id (format: domain.entity_name)
-    entity_domain = entity_id.split(".", 1)[0] if "." in entity_id else None
+    # Check the (cached) domain first; only matching IDs hit the state machine
+    entity_domain = _domain_of(entity_id)
 
     if entity_domain != domain:
         _LOGGER.debug(
@@ -65,42 +75,35 @@ def validate_entity_domain(
         )
         return False
 
-    return True
+    return validate_entity_exists(hass, entity_id)
 
 
 def validate_entity_state(
     hass: HomeAssistant,
     entity_id: str,
-    valid_states: list[str],
+    valid_states: Collection[str],
 ) -> bool:
     """Validate that an entity is in one of the valid states.
 
     Args:
         hass: Home Assistant instance
         entity_id: Entity ID to validate
-        valid_states: List of valid state values
+        valid_states: Valid state values; pass a module-level frozenset on
+            repeated calls for O(1) membership (lists are still accepted)
 
     Returns:
         True if entity is in a valid state, False otherwise
     """
-    if not validate_entity_exists(hass, entity_id):
+    if not entity_id:
         return False
 
+    # Single state machine lookup (instead of validate_entity_exists + get)
     state = hass.states.get(entity_id)
     if state is None:
+        _LOGGER.debug("Entity %s does not exist", entity_id)
         return False
 
-    entity_state = state.state
-    if entity_state not in valid_states:
-        _LOGGER.debug(
-            "Entity %s is not in valid states %s (current: %s)",
-            entity_id,
-            valid_states,
-            entity_state,
-        )
-        return False
-
-    return True
+    return check_state(state, valid_states)
 
 
 def validate_entity_available(hass: HomeAssistant, entity_id: str) -> bool:
@@ -113,21 +116,60 @@ def validate_entity_available(hass: HomeAssistant, entity_id: str) -> bool:
     Returns:
         True if entity is available, False otherwise
     """
-    if not validate_entity_exists(hass, entity_id):
+    if not entity_id:
         return False
 
+    # Single state machine lookup (instead of validate_entity_exists + get)
     state = hass.states.get(entity_id)
     if state is None:
+        _LOGGER.debug("Entity %s does not exist", entity_id)
         return False
 
-    entity_state = state.state
-    unavailable_states = {"unavailable", "unknown", "None"}
+    return check_available(state)
+
+
+def check_state(state: State | None, valid_states: Collection[str]) -> bool:
+    """Check that an already-resolved state is one of the valid states.
 
-    if entity_state in unavailable_states:
+    Args:
+        state: Entity state from the state machine (None if missing)
+        valid_states: Valid state values
+
+    Returns:
+        True if entity is in a valid state, False otherwise
+    """
+    if state is None:
+        return False
+
+    if state.state not in valid_states:
+        _LOGGER.debug(
+            "Entity %s is not in valid states %s (current: %s)",
+            state.entity_id,
+            valid_states,
+            state.state,
+        )
+        return False
+
+    return True
+
+
+def check_available(state: State | None) -> bool:
+    """Check that an already-resolved state is available.
+
+    Args:
+        state: Entity state from the state machine (None if missing)
+
+    Returns:
+        True if entity is available, False otherwise
+    """
+    if state is None:
+        return False
+
+    if state.state in _UNAVAILABLE_STATES:
         _LOGGER.debug(
             "Entity %s is not available (state: %s)",
-            entity_id,
-            entity_state,
+            state.entity_id,
+            state.state,
         )
         return False
 
@@ -144,7 +186,14 @@ def get_entity_domain(hass: HomeAssistant, entity_id: str) -> str | None:
     Returns:
         Domain name if found, None otherwise
     """
-    if not entity_id or "." not in entity_id:
-        return None
+    return _domain_of(entity_id)
 
-    return entity_id.split(".", 1)[0]
+
+@lru_cache(maxsize=512)
+def _domain_of(entity_id: str) -> str | None:
+    """Extract the domain from an entity ID (format: domain.entity_name).
+
+    Pure function of the entity ID, cached since the same IDs recur.
+    """
+    head, sep, _ = entity_id.partition(".")
+    return head if sep else None
@@ -9,7 +9,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_DOMAIN,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +32,31 @@ class NotificationService:
             hass: Home Assistant instance
         """
         self.hass = hass
+        self._cached_notify: str | None = None
+        self._unsub_service_events: list[CALLBACK_TYPE] = []
+
+    @callback
+    def _async_service_changed(self, event: Event) -> None:
+        """Invalidate the cached notify service when notify services change."""
+        if event.data.get(ATTR_DOMAIN) == "notify":
+            self._cached_notify = None
+
+    def _listen_for_service_changes(self) -> None:
+        """Subscribe to service registry changes (once)."""
+        if self._unsub_service_events:
+            return
+        self._unsub_service_events = [
+            self.hass.bus.async_listen(event_type, self._async_service_changed)
+            for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED)
+        ]
+
+    @callback
+    def async_unload(self) -> None:
+        """Remove service registry listeners and drop the cached service."""
+        for unsub in self._unsub_service_events:
+            unsub()
+        self._unsub_service_events.clear()
+        self._cached_notify = None
 
     async def send_persistent_notification(
         self,
@@ -96,12 +126,11 @@ class NotificationService:
             return False
 
         try:
-            service_data: dict[str, Any] = {
-                "title": title,
-                "message": message,
-            }
-            if data:
-                service_data.update(data)
+            service_data: dict[str, Any] = (
+                {"title": title, "message": message, **data}
+                if data
+                else {"title": title, "message": message}
+            )
 
             await self.hass.services.async_call(
                 "notify",
@@ -180,17 +209,17 @@ class NotificationService:
         Returns:
             Service name if found, None otherwise
         """
-        if target and f"notify.{target}" in self.hass.services.async_services().get(
-            "notify", {}
-        ):
+        if target is None and self._cached_notify is not None:
+            return self._cached_notify
+
+        notify_services = self.hass.services.async_services_for_domain("notify")
+        if target and target in notify_services:
             return target
 
         # Find first available notify service
-        notify_services = self.hass.services.async_services().get("notify", {})
-        if notify_services:
-            # Return first available service
-            service_keys = list(notify_services.keys())
-            if service_keys:
-                return str(service_keys[0])
-
-        return None
+        first_service = next(iter(notify_services), None)
+        if first_service is not None:
+            self._cached_notify = str(first_service)
+            self._listen_for_service_changes()
+
+        return self._cached_notify
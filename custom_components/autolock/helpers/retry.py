@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import TypeVar
@@ -17,7 +18,7 @@ _LOGGER = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryResult:
     """Result of a retry operation."""
 
@@ -49,6 +50,8 @@ class RetryStrategy:
             logger: Optional logger for retry attempts
         """
         self.logger = logger or _LOGGER
+        # Private generator for jitter, not shared with other random users
+        self._rng = random.Random()
 
     async def execute_with_retry(
         self,
@@ -73,9 +76,11 @@ class RetryStrategy:
             RetryResult with success status, attempts, and error details
         """
         attempt = 0
-        current_delay = delay
+        # Without backoff the delay is constant, so clamp it once up front
+        current_delay = delay if exponential_backoff else min(delay, max_delay)
         last_error: Exception | None = None
         last_error_str: str | None = None
+        _uniform = self._rng.uniform
 
         while attempt <= max_retries:
             try:
@@ -104,18 +109,14 @@ class RetryStrategy:
                     )
                     break
 
-                # Calculate delay for next retry
+                # Calculate delay for next retry (only reached when retrying)
                 if exponential_backoff:
                     current_delay = min(current_delay * 2, max_delay)
-                else:
-                    current_delay = delay
 
                 # Add jitter to prevent thundering herd
                 if jitter:
-                    import random
-
                     jitter_amount = current_delay * 0.1  # 10% jitter
-                    actual_delay = current_delay + random.uniform(
+                    actual_delay = current_delay + _uniform(
                         -jitter_amount, jitter_amount
                     )
                     actual_delay = max(0.1, actual_delay)  # Minimum 0.1 seconds
@@ -6,24 +6,41 @@ needing day/night schedules (lights, thermostats, locks, etc.).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Final
 
 # Time format for parsing
 TIME_FORMAT: Final = "%H:%M"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduleConfig:
     """Configuration for day/night schedule."""
 
     start_time: time
     end_time: time
+    # Minutes since midnight, derived from start_time/end_time
+    start_minutes: int = field(init=False, repr=False, compare=False)
+    end_minutes: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute range bounds as minutes since midnight."""
+        object.__setattr__(
+            self, "start_minutes", self.start_time.hour * 60 + self.start_time.minute
+        )
+        object.__setattr__(
+            self, "end_minutes", self.end_time.hour * 60 + self.end_time.minute
+        )
 
     @classmethod
+    @lru_cache(maxsize=128)
     def from_strings(cls, start_str: str, end_str: str) -> ScheduleConfig:
-        """Create schedule config from time strings (HH:MM format)."""
+        """Create schedule config from time strings (HH:MM format).
+
+        Configs are immutable, so identical HH:MM pairs share one cached instance.
+        """
         return cls(
             start_time=parse_time_string(start_str),
             end_time=parse_time_string(end_str),
@@ -79,7 +96,7 @@ class ScheduleCalculator:
         Returns:
             True if in night schedule, False otherwise
         """
-        return is_time_in_range(now, schedule.start_time, schedule.end_time)
+        return is_time_in_range_minutes(now, schedule)
 
     @staticmethod
     def get_delay(
@@ -107,9 +124,12 @@ class ScheduleCalculator:
         return day_delay
 
 
+@lru_cache(maxsize=256)
 def parse_time_string(time_str: str) -> time:
     """Parse time string in HH:MM format to time object.
 
+    Results are cached; there are at most 24 * 60 distinct valid inputs.
+
     Args:
         time_str: Time string in HH:MM format (e.g., "22:00")
 
@@ -119,10 +139,20 @@ def parse_time_string(time_str: str) -> time:
     Raises:
         ValueError: If time string is invalid
     """
-    try:
-        return datetime.strptime(time_str, TIME_FORMAT).time()
-    except ValueError as err:
-        raise ValueError(f"Invalid time format: {time_str}. Expected HH:MM") from err
+    # Hand-rolled equivalent of strptime(time_str, TIME_FORMAT)
+    hours, sep, minutes = time_str.partition(":")
+    if (
+        sep
+        and 0 < len(hours) <= 2
+        and 0 < len(minutes) <= 2
+        and hours.isdigit()
+        and minutes.isdigit()
+    ):
+        try:
+            return time(int(hours), int(minutes))
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid time format: {time_str}. Expected HH:MM")
 
 
 def is_time_in_range(now: datetime, start_time: time, end_time: time) -> bool:
@@ -147,3 +177,29 @@ def is_time_in_range(now: datetime, start_time: time, end_time: time) -> bool:
 
     # Normal range (e.g., 09:00-17:00)
     return start_time <= current_time <= end_time
+
+
+def is_time_in_range_minutes(now: datetime, schedule: ScheduleConfig) -> bool:
+    """Check if current time is within a schedule's range, at minute resolution.
+
+    Compares minutes since midnight against the bounds precomputed on the
+    schedule, so the whole end minute counts as in range. Handles midnight
+    crossing like is_time_in_range.
+
+    Args:
+        now: Current datetime
+        schedule: Schedule configuration
+
+    Returns:
+        True if current time is in range, False otherwise
+    """
+    current = now.hour * 60 + now.minute
+    start = schedule.start_minutes
+    end = schedule.end_minutes
+
+    # Handle midnight crossing (e.g., 22:00-06:00)
+    if start > end:
+        return current >= start or current <= end
+
+    # Normal range (e.g., 09:00-17:00)
+    return start <= current <= end
@@ -8,15 +8,24 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
+from typing import Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import LOCK_STATE_LOCKED
+from .helpers import check_state
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lock states meaning there is nothing left to do
+_LOCKED_STATES: Final[frozenset[str]] = frozenset({LOCK_STATE_LOCKED})
 
-@dataclass
+# Door sensor states meaning the door is closed
+_DOOR_CLOSED_STATES: Final[frozenset[str]] = frozenset({"on"})
+
+
+@dataclass(frozen=True, slots=True)
 class LockResult:
     """Result of a lock operation."""
 
@@ -53,12 +62,12 @@ class SafetyValidator:
         Returns:
             Tuple of (can_lock: bool, reason: str | None)
         """
-        # Check lock state
+        # Resolve each entity once; the state checks then run on that State
         lock_state = self.hass.states.get(lock_entity)
         if lock_state is None:
             return False, f"Lock entity {lock_entity} not found"
 
-        if lock_state.state == LOCK_STATE_LOCKED:
+        if check_state(lock_state, _LOCKED_STATES):
             return False, "Lock is already locked"
 
         # Check door sensor if provided
@@ -68,7 +77,7 @@ class SafetyValidator:
                 return False, f"Sensor entity {sensor_entity} not found"
 
             # Door closed = sensor state "on"
-            if sensor_state.state != "on":
+            if not check_state(sensor_state, _DOOR_CLOSED_STATES):
                 return False, "Door is open"
 
         return True, None
@@ -89,28 +98,44 @@ class SafetyValidator:
         Returns:
             Tuple of (verified: bool, reason: str | None)
         """
-        start_time = asyncio.get_event_loop().time()
-        poll_interval = 0.5  # Poll every 0.5 seconds
-
-        while True:
-            lock_state = self.hass.states.get(lock_entity)
-            if lock_state is None:
-                return False, f"Lock entity {lock_entity} not found"
-
-            if lock_state.state == expected_state:
-                return True, None
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
-                current_state = lock_state.state
-                return (
-                    False,
-                    f"Lock did not reach state {expected_state} within "
-                    f"{timeout}s (current: {current_state})",
-                )
-
-            await asyncio.sleep(poll_interval)
+        states_get = self.hass.states.get
+        lock_state = states_get(lock_entity)
+        if lock_state is None:
+            return False, f"Lock entity {lock_entity} not found"
+
+        # Fast path: lock already reached the expected state
+        if lock_state.state == expected_state:
+            return True, None
+
+        settled = asyncio.Event()
+
+        @callback
+        def _on_change(event: Event[EventStateChangedData]) -> None:
+            """Wake the waiter when the lock reaches the state or disappears."""
+            new_state = event.data["new_state"]
+            if new_state is None or new_state.state == expected_state:
+                settled.set()
+
+        unsub = async_track_state_change_event(self.hass, [lock_entity], _on_change)
+        try:
+            await asyncio.wait_for(settled.wait(), timeout)
+        except TimeoutError:
+            pass
+        finally:
+            unsub()
+
+        lock_state = states_get(lock_entity)
+        if lock_state is None:
+            return False, f"Lock entity {lock_entity} not found"
+
+        if lock_state.state == expected_state:
+            return True, None
+
+        return (
+            False,
+            f"Lock did not reach state {expected_state} within "
+            f"{timeout}s (current: {lock_state.state})",
+        )
 
     async def lock_with_verification(
         self,
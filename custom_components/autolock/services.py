@@ -3,25 +3,29 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+from datetime import timedelta
+from typing import Final
 
 import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    AUTOLOCK_ENABLED_TEMPLATE,
-    AUTOLOCK_SNOOZE_TEMPLATE,
     DOMAIN,
     SNOOZE_DURATION_15,
     SNOOZE_DURATION_30,
     SNOOZE_DURATION_60,
 )
+from .door import AutolockRegistry
 from .safety import SafetyValidator
 
 _LOGGER = logging.getLogger(__name__)
 
+_VALID_SNOOZE_DURATIONS: Final[frozenset[int]] = frozenset(
+    (SNOOZE_DURATION_15, SNOOZE_DURATION_30, SNOOZE_DURATION_60)
+)
+
 # Service schemas
 SERVICE_LOCK_NOW_SCHEMA = cv.make_entity_service_schema({})
 SERVICE_SNOOZE_SCHEMA = cv.make_entity_service_schema(
@@ -35,6 +39,8 @@ SERVICE_DISABLE_SCHEMA = cv.make_entity_service_schema({})
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up AutoLock services."""
+    # Services resolve doors through the registry shared with the config entries
+    registry: AutolockRegistry = hass.data.setdefault(DOMAIN, AutolockRegistry())
 
     async def lock_now_service(call: ServiceCall) -> None:
         """Service to lock door immediately."""
@@ -43,8 +49,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("door_id required for lock_now service")
             return
 
-        # Get door instance from config entry
-        door = _get_door_instance(hass, door_id)
+        door = registry.doors.get(door_id)
         if not door:
             _LOGGER.error("Door %s not found", door_id)
             return
@@ -82,30 +87,27 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             return
 
         # Validate duration
-        valid_durations = [SNOOZE_DURATION_15, SNOOZE_DURATION_30, SNOOZE_DURATION_60]
-        if duration not in valid_durations:
+        if duration not in _VALID_SNOOZE_DURATIONS:
             _LOGGER.error(
                 "Invalid snooze duration: %d (must be 15, 30, or 60)", duration
             )
             return
 
-        # Get door instance
-        door = _get_door_instance(hass, door_id)
+        door = registry.doors.get(door_id)
         if not door:
             _LOGGER.error("Door %s not found", door_id)
             return
 
         # Calculate snooze until time
-        snooze_until = datetime.now() + timedelta(minutes=duration)
-        snooze_entity = AUTOLOCK_SNOOZE_TEMPLATE.format(door_id=door_id)
+        snooze_until = dt_util.now() + timedelta(minutes=duration)
 
         # Set snooze time
         await hass.services.async_call(
             "input_datetime",
             "set_datetime",
             {
-                "entity_id": snooze_entity,
-                "datetime": snooze_until.strftime("%Y-%m-%d %H:%M:%S"),
+                "entity_id": door.snooze_entity,
+                "datetime": snooze_until.isoformat(sep=" ", timespec="seconds"),
             },
         )
 
@@ -122,16 +124,15 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("door_id required for enable service")
             return
 
-        door = _get_door_instance(hass, door_id)
+        door = registry.doors.get(door_id)
         if not door:
             _LOGGER.error("Door %s not found", door_id)
             return
 
-        enabled_entity = AUTOLOCK_ENABLED_TEMPLATE.format(door_id=door_id)
         await hass.services.async_call(
             "input_boolean",
             "turn_on",
-            {"entity_id": enabled_entity},
+            {"entity_id": door.enabled_entity},
         )
 
         _LOGGER.info("Enabled door: %s", door.config["name"])
@@ -143,16 +144,15 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("door_id required for disable service")
             return
 
-        door = _get_door_instance(hass, door_id)
+        door = registry.doors.get(door_id)
         if not door:
             _LOGGER.error("Door %s not found", door_id)
             return
 
-        enabled_entity = AUTOLOCK_ENABLED_TEMPLATE.format(door_id=door_id)
         await hass.services.async_call(
             "input_boolean",
             "turn_off",
-            {"entity_id": enabled_entity},
+            {"entity_id": door.enabled_entity},
         )
 
         _LOGGER.info("Disabled door: %s", door.config["name"])
@@ -187,18 +187,3 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     )
 
     _LOGGER.info("AutoLock services registered")
-
-
-def _get_door_instance(hass: HomeAssistant, door_id: str) -> Any:
-    """Get door instance from config entry.
-
-    Args:
-        hass: Home Assistant instance
-        door_id: Door identifier
-
-    Returns:
-        AutolockDoor instance or None
-    """
-    # Get from domain data
-    domain_data = hass.data.get(DOMAIN, {})
-    return domain_data.get(door_id)
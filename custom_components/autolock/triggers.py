@@ -5,28 +5,62 @@ Provides different trigger types (sensor-based vs lock-based).
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Protocol
 
-from homeassistant.core import HomeAssistant
 
+class TriggerStrategy(Protocol):
+    """Structural interface for trigger strategies.
 
-class TriggerStrategy(ABC):
-    """Abstract base class for trigger strategies."""
+    Strategies implement it by shape; they do not inherit from it.
+    """
 
-    @abstractmethod
-    def get_triggers(self) -> list[dict[str, Any]]:
+    def get_triggers(self) -> tuple[Mapping[str, Any], ...]:
         """Get automation trigger configuration.
 
         Returns:
-            List of trigger dictionaries for HA automation
+            Tuple of read-only trigger mappings for HA automation
         """
-        raise NotImplementedError
+        ...
+
+
+@lru_cache(maxsize=256)
+def _sensor_trigger(sensor_entity: str) -> Mapping[str, Any]:
+    """Build the shared, read-only trigger payload for a sensor.
+
+    Args:
+        sensor_entity: Binary sensor entity ID
+
+    Returns:
+        Trigger mapping for sensor state change to "on" (door closed)
+    """
+    return MappingProxyType(
+        {"platform": "state", "entity_id": sensor_entity, "to": "on"}
+    )
 
 
-class SensorTriggerStrategy(TriggerStrategy):
+@lru_cache(maxsize=256)
+def _lock_trigger(lock_entity: str) -> Mapping[str, Any]:
+    """Build the shared, read-only trigger payload for a lock.
+
+    Args:
+        lock_entity: Lock entity ID
+
+    Returns:
+        Trigger mapping for lock state change to "unlocked"
+    """
+    return MappingProxyType(
+        {"platform": "state", "entity_id": lock_entity, "to": "unlocked"}
+    )
+
+
+class SensorTriggerStrategy:
     """Trigger strategy using binary_sensor state changes."""
 
+    __slots__ = ("_triggers", "sensor_entity")
+
     def __init__(self, sensor_entity: str) -> None:
         """Initialize sensor trigger strategy.
 
@@ -34,25 +68,24 @@ class SensorTriggerStrategy(TriggerStrategy):
             sensor_entity: Binary sensor entity ID
         """
         self.sensor_entity = sensor_entity
+        self._triggers: tuple[Mapping[str, Any], ...] = (
+            _sensor_trigger(sensor_entity),
+        )
 
-    def get_triggers(self) -> list[dict[str, Any]]:
+    def get_triggers(self) -> tuple[Mapping[str, Any], ...]:
         """Get sensor-based triggers.
 
         Returns:
-            List with single trigger for sensor state change to "on" (door closed)
+            Tuple with single trigger for sensor state change to "on" (door closed)
         """
-        return [
-            {
-                "platform": "state",
-                "entity_id": self.sensor_entity,
-                "to": "on",  # Door closed
-            }
-        ]
+        return self._triggers
 
 
-class LockTriggerStrategy(TriggerStrategy):
+class LockTriggerStrategy:
     """Trigger strategy using lock state changes (fallback)."""
 
+    __slots__ = ("_triggers", "lock_entity")
+
     def __init__(self, lock_entity: str) -> None:
         """Initialize lock trigger strategy.
 
@@ -60,31 +93,27 @@ class LockTriggerStrategy(TriggerStrategy):
             lock_entity: Lock entity ID
         """
         self.lock_entity = lock_entity
+        self._triggers: tuple[Mapping[str, Any], ...] = (_lock_trigger(lock_entity),)
 
-    def get_triggers(self) -> list[dict[str, Any]]:
+    def get_triggers(self) -> tuple[Mapping[str, Any], ...]:
         """Get lock-based triggers.
 
         Returns:
-            List with single trigger for lock state change to "unlocked"
+            Tuple with single trigger for lock state change to "unlocked"
         """
-        return [
-            {
-                "platform": "state",
-                "entity_id": self.lock_entity,
-                "to": "unlocked",
-            }
-        ]
+        return self._triggers
 
 
+@lru_cache(maxsize=128)
 def create_trigger_strategy(
-    hass: HomeAssistant,
     lock_entity: str,
     sensor_entity: str | None = None,
 ) -> TriggerStrategy:
     """Create appropriate trigger strategy.
 
+    Strategies are immutable, so one instance is shared per entity pair.
+
     Args:
-        hass: Home Assistant instance
         lock_entity: Lock entity ID
         sensor_entity: Optional sensor entity ID
 
@@ -6,11 +6,19 @@ Uses helpers for generic validation, adds autolock-specific validation.
 from __future__ import annotations
 
 import logging
+import warnings
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.core import HomeAssistant
 
 from .const import (
+    DEFAULT_DAY_DELAY,
+    DEFAULT_ENABLE_ON_CREATION,
+    DEFAULT_NIGHT_DELAY,
+    DEFAULT_RETRY_COUNT,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_VERIFICATION_DELAY,
     MAX_DAY_DELAY,
     MAX_NIGHT_DELAY,
     MAX_RETRY_COUNT,
@@ -25,6 +33,7 @@ from .const import (
 from .helpers.entity_validation import (
     validate_entity_domain,
 )
+from .helpers.schedule import parse_time_string
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +67,9 @@ def validate_sensor_entity(hass: HomeAssistant, entity_id: str) -> bool:
 def validate_delay(min_value: int, max_value: int, value: int) -> bool:
     """Validate delay value is within range.
 
+    Deprecated: compare inline (``min_value <= value <= max_value``) or use the
+    prebuilt *_VALIDATOR schemas. Kept for one release for external callers.
+
     Args:
         min_value: Minimum allowed value
         max_value: Maximum allowed value
@@ -66,6 +78,11 @@ def validate_delay(min_value: int, max_value: int, value: int) -> bool:
     Returns:
         True if value is in range, False otherwise
     """
+    warnings.warn(
+        "validate_delay is deprecated; compare min_value <= value <= max_value",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     return min_value <= value <= max_value
 
 
@@ -80,8 +97,6 @@ def validate_schedule(start_time: str, end_time: str) -> bool:
         True if valid schedule, False otherwise
     """
     try:
-        from .helpers.schedule import parse_time_string
-
         parse_time_string(start_time)
         parse_time_string(end_time)
         return True
@@ -89,6 +104,24 @@ def validate_schedule(start_time: str, end_time: str) -> bool:
         return False
 
 
+# Field validators, shared by the config flow and options flow schemas
+DAY_DELAY_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_DAY_DELAY, max=MAX_DAY_DELAY)
+)
+NIGHT_DELAY_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_NIGHT_DELAY, max=MAX_NIGHT_DELAY)
+)
+RETRY_COUNT_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_RETRY_COUNT, max=MAX_RETRY_COUNT)
+)
+RETRY_DELAY_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY)
+)
+VERIFICATION_DELAY_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_VERIFICATION_DELAY, max=MAX_VERIFICATION_DELAY),
+)
+
 # Voluptuous schemas for config flow
 SCHEMA_BASE = vol.Schema(
     {
@@ -103,40 +136,55 @@ SCHEMA_SENSOR = vol.Schema(
     }
 )
 
-SCHEMA_TIMING = vol.Schema(
-    {
-        vol.Required("day_delay", default=5): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=MIN_DAY_DELAY, max=MAX_DAY_DELAY),
-        ),
-        vol.Required("night_delay", default=2): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=MIN_NIGHT_DELAY, max=MAX_NIGHT_DELAY),
-        ),
-        vol.Required("night_start"): str,  # HH:MM format
-        vol.Required("night_end"): str,  # HH:MM format
-    }
-)
+# Schema key maps, built once at import (marker -> validator)
+_TIMING_KEY_MAP: Final[dict[vol.Marker, Any]] = {
+    vol.Required("day_delay", default=DEFAULT_DAY_DELAY): DAY_DELAY_VALIDATOR,
+    vol.Required("night_delay", default=DEFAULT_NIGHT_DELAY): NIGHT_DELAY_VALIDATOR,
+    vol.Required("night_start"): str,  # HH:MM format
+    vol.Required("night_end"): str,  # HH:MM format
+}
+
+_RETRY_KEY_MAP: Final[dict[vol.Marker, Any]] = {
+    vol.Required("retry_count", default=DEFAULT_RETRY_COUNT): RETRY_COUNT_VALIDATOR,
+    vol.Required("retry_delay", default=DEFAULT_RETRY_DELAY): RETRY_DELAY_VALIDATOR,
+    vol.Required(
+        "verification_delay", default=DEFAULT_VERIFICATION_DELAY
+    ): VERIFICATION_DELAY_VALIDATOR,
+}
 
-SCHEMA_RETRY = vol.Schema(
+SCHEMA_TIMING = vol.Schema(_TIMING_KEY_MAP, extra=vol.PREVENT_EXTRA)
+
+SCHEMA_RETRY = vol.Schema(_RETRY_KEY_MAP, extra=vol.PREVENT_EXTRA)
+
+SCHEMA_OPTIONS = vol.Schema(
     {
-        vol.Required("retry_count", default=3): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=MIN_RETRY_COUNT, max=MAX_RETRY_COUNT),
-        ),
-        vol.Required("retry_delay", default=5): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY),
-        ),
-        vol.Required("verification_delay", default=5): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=MIN_VERIFICATION_DELAY, max=MAX_VERIFICATION_DELAY),
-        ),
+        vol.Required("enable_on_creation", default=DEFAULT_ENABLE_ON_CREATION): bool,
     }
 )
 
-SCHEMA_OPTIONS = vol.Schema(
+# Complete config entry data (all config flow steps merged), for one-pass
+# revalidation of stored or updated entries
+FULL_SCHEMA = vol.Schema(
     {
-        vol.Required("enable_on_creation", default=True): bool,
+        **SCHEMA_BASE.schema,
+        **SCHEMA_SENSOR.schema,
+        **SCHEMA_TIMING.schema,
+        **SCHEMA_RETRY.schema,
+        **SCHEMA_OPTIONS.schema,
     }
 )
+
+
+def validate_full_config(data: dict[str, Any]) -> dict[str, Any]:
+    """Validate complete door config entry data in a single schema pass.
+
+    Args:
+        data: Config entry data
+
+    Returns:
+        Validated data with defaults applied
+
+    Raises:
+        vol.Invalid: If the data is invalid
+    """
+    return FULL_SCHEMA(data)
@@ -2,39 +2,133 @@
 
 from __future__ import annotations
 
+import tempfile
+from collections.abc import AsyncGenerator, Callable
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.core import HomeAssistant
+import pytest_asyncio
+from homeassistant import core as ha_core
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, async_get_hass_or_none
 
+from custom_components.autolock.const import DOMAIN
+from custom_components.autolock.helpers.notifications import NotificationService
+from custom_components.autolock.helpers.retry import RetryStrategy
 
-@pytest.fixture
-def hass() -> HomeAssistant:
-    """Create Home Assistant instance."""
-    from homeassistant.core import HomeAssistant
 
-    return HomeAssistant()
+@pytest_asyncio.fixture(scope="module")
+async def _module_hass() -> AsyncGenerator[HomeAssistant]:
+    """Start a real Home Assistant instance once per test module.
+
+    It runs on the session event loop shared by every async test.
+    """
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        pytest.MonkeyPatch.context() as monkeypatch,
+    ):
+        # HomeAssistant() registers itself as the thread's current instance.
+        # Snapshot that slot so it is restored on teardown and later mock-based
+        # tests don't resolve the stopped instance; setattr raises if Home
+        # Assistant ever renames it.
+        monkeypatch.setattr(ha_core._hass, "hass", async_get_hass_or_none())
+        instance = HomeAssistant(config_dir)
+        await instance.async_start()
+        yield instance
+        await instance.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def hass(_module_hass: HomeAssistant) -> HomeAssistant:
+    """Return the shared Home Assistant instance without integration state."""
+    _module_hass.data.pop(DOMAIN, None)
+    for state in _module_hass.states.async_all():
+        _module_hass.states.async_remove(state.entity_id)
+    return _module_hass
+
+
+@pytest.fixture(scope="session")
+def _session_mock_hass() -> MagicMock:
+    """Create the spec'd mock Home Assistant instance once per test session.
+
+    Building MagicMock(spec=HomeAssistant) walks the whole HomeAssistant class,
+    so it is shared and reset by mock_hass instead of rebuilt for every test.
+    """
+    return MagicMock(spec=HomeAssistant)
 
 
 @pytest.fixture
-async def mock_hass():
-    """Create mock Home Assistant instance."""
-    hass = MagicMock(spec=HomeAssistant)
+def mock_hass(_session_mock_hass: MagicMock) -> MagicMock:
+    """Return the shared mock Home Assistant instance in a clean state."""
+    hass = _session_mock_hass
+    hass.reset_mock(return_value=True, side_effect=True)
+    # Tests replace these wholesale, so rebuild them rather than reset them
     hass.states = MagicMock()
     hass.states.get = MagicMock(return_value=None)
     hass.services = MagicMock()
     hass.services.async_call = AsyncMock()
     hass.bus = MagicMock()
     hass.bus.async_listen = MagicMock(return_value=lambda: None)
+    hass.config_entries = MagicMock()
     hass.data = {}
     return hass
 
 
+class _StubServices:
+    """Service registry double: real notify lookups, AsyncMock service calls."""
+
+    def __init__(self) -> None:
+        self.async_call = AsyncMock()
+        self.notify: dict[str, dict] = {}
+        self.lookups: list[str] = []
+
+    def async_services_for_domain(self, domain: str) -> dict[str, dict]:
+        self.lookups.append(domain)
+        return self.notify if domain == "notify" else {}
+
+
+class _StubBus:
+    """Event bus double that records listeners and honours unsubscribe."""
+
+    def __init__(self) -> None:
+        self.listeners: list[tuple[str, Callable]] = []
+
+    def async_listen(self, event_type: str, listener: Callable) -> Callable:
+        entry = (event_type, listener)
+        self.listeners.append(entry)
+        return lambda: self.listeners.remove(entry)
+
+
+class _StubHass:
+    """The slice of HomeAssistant that NotificationService touches."""
+
+    def __init__(self) -> None:
+        self.services = _StubServices()
+        self.bus = _StubBus()
+        self.data: dict = {}
+
+
+@pytest.fixture
+def stub_hass() -> _StubHass:
+    """Create a plain-object hass double, cheaper than a MagicMock tree."""
+    return _StubHass()
+
+
+@pytest.fixture(scope="session")
+def retry_strategy() -> RetryStrategy:
+    """Create one RetryStrategy for the session; it keeps no per-call state."""
+    return RetryStrategy()
+
+
+@pytest.fixture
+def notification_service(stub_hass: _StubHass) -> NotificationService:
+    """Create a NotificationService bound to a fresh stub hass."""
+    return NotificationService(stub_hass)
+
+
 @pytest.fixture
 def mock_config_entry():
     """Create mock config entry."""
-    from homeassistant.config_entries import ConfigEntry
-
     entry = MagicMock(spec=ConfigEntry)
     entry.unique_id = "test_door_1"
     entry.entry_id = "test_entry_1"
@@ -6,7 +6,13 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.autolock.helpers.entity_factory import EntityFactory
+from custom_components.autolock.helpers import entity_factory
+
+
+@pytest.fixture(autouse=True)
+def clear_created():
+    """Start every test with an empty created-entity cache."""
+    entity_factory.clear_created_cache()
 
 
 class TestGenerateEntityId:
@@ -14,7 +20,7 @@ class TestGenerateEntityId:
 
     def test_generate_entity_id(self):
         """Test generate_entity_id."""
-        entity_id = EntityFactory.generate_entity_id(
+        entity_id = entity_factory.generate_entity_id(
             "autolock", "door1", "input_boolean"
         )
         assert entity_id == "input_boolean.autolock_door1"
@@ -26,7 +32,7 @@ class TestCreateScriptYaml:
     def test_create_script_yaml(self):
         """Test create_script_yaml."""
         sequence = [{"service": "test.service", "data": {}}]
-        config = EntityFactory.create_script_yaml(
+        config = entity_factory.create_script_yaml(
             "script.test", "Test Script", sequence, alias="Test"
         )
 
@@ -42,7 +48,7 @@ class TestCreateAutomationYaml:
         """Test basic automation yaml."""
         triggers = [{"platform": "state", "entity_id": "test.entity"}]
         actions = [{"service": "test.service"}]
-        config = EntityFactory.create_automation_yaml(
+        config = entity_factory.create_automation_yaml(
             "automation.test", "Test Automation", triggers, actions=actions
         )
 
@@ -57,7 +63,7 @@ class TestCreateAutomationYaml:
         conditions = [{"condition": "state", "entity_id": "sensor.test", "state": "on"}]
         actions = [{"service": "light.turn_on", "entity_id": "light.test"}]
 
-        result = EntityFactory.create_automation_yaml(
+        result = entity_factory.create_automation_yaml(
             "automation.test",
             "Test Automation",
             triggers,
@@ -75,26 +81,22 @@ class TestCreateAutomationYaml:
 class TestCreateInputBoolean:
     """Tests for create_input_boolean."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass):
         """Test successful creation."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock()
 
-        result = await EntityFactory.create_input_boolean(
+        result = await entity_factory.create_input_boolean(
             mock_hass, "input_boolean.test", "Test", initial_state=True
         )
 
         assert result is True
         mock_hass.services.async_call.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_with_icon(self, mock_hass):
         """Test with icon."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock()
 
-        result = await EntityFactory.create_input_boolean(
+        result = await entity_factory.create_input_boolean(
             mock_hass, "input_boolean.test", "Test", icon="mdi:lock"
         )
 
@@ -102,72 +104,100 @@ class TestCreateInputBoolean:
         call_args = mock_hass.services.async_call.call_args
         assert call_args[0][2].get("icon") == "mdi:lock"
 
-    @pytest.mark.asyncio
     async def test_already_exists(self, mock_hass):
         """Test when already exists."""
         existing_state = MagicMock()
         mock_hass.states.get.return_value = existing_state
 
-        result = await EntityFactory.create_input_boolean(
+        result = await entity_factory.create_input_boolean(
             mock_hass, "input_boolean.test", "Test"
         )
 
         assert result is True
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_exception(self, mock_hass):
         """Test with exception."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock(
             side_effect=Exception("Service error")
         )
 
-        result = await EntityFactory.create_input_boolean(
+        result = await entity_factory.create_input_boolean(
             mock_hass, "input_boolean.test", "Test"
         )
 
         assert result is False
 
+    async def test_cached_after_success(self, mock_hass):
+        """Test repeated creation skips the state lookup."""
+        mock_hass.services.async_call = AsyncMock()
+
+        await entity_factory.create_input_boolean(
+            mock_hass, "input_boolean.test", "Test"
+        )
+        mock_hass.states.get.reset_mock()
+
+        result = await entity_factory.create_input_boolean(
+            mock_hass, "input_boolean.test", "Test"
+        )
+
+        assert result is True
+        mock_hass.states.get.assert_not_called()
+        mock_hass.services.async_call.assert_called_once()
+
+    async def test_not_cached_after_exception(self, mock_hass):
+        """Test failed creation is retried on the next call."""
+        mock_hass.services.async_call = AsyncMock(
+            side_effect=Exception("Service error")
+        )
+
+        await entity_factory.create_input_boolean(
+            mock_hass, "input_boolean.test", "Test"
+        )
+
+        assert "input_boolean.test" not in entity_factory._created
+
 
 class TestCreateInputDatetime:
     """Tests for create_input_datetime."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass):
         """Test successful creation."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock()
 
-        result = await EntityFactory.create_input_datetime(
+        result = await entity_factory.create_input_datetime(
             mock_hass, "input_datetime.test", "Test", has_date=False, has_time=True
         )
 
         assert result is True
         mock_hass.services.async_call.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_already_exists(self, mock_hass):
         """Test when already exists."""
         existing_state = MagicMock()
         mock_hass.states.get.return_value = existing_state
 
-        result = await EntityFactory.create_input_datetime(
+        result = await entity_factory.create_input_datetime(
             mock_hass, "input_datetime.test", "Test"
         )
 
         assert result is True
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
+        # Second call is answered from the cache
+        mock_hass.states.get.reset_mock()
+        await entity_factory.create_input_datetime(
+            mock_hass, "input_datetime.test", "Test"
+        )
+        mock_hass.states.get.assert_not_called()
+
     async def test_exception(self, mock_hass):
         """Test with exception."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock(
             side_effect=Exception("Service error")
         )
 
-        result = await EntityFactory.create_input_datetime(
+        result = await entity_factory.create_input_datetime(
             mock_hass, "input_datetime.test", "Test"
         )
 
@@ -177,38 +207,38 @@ class TestCreateInputDatetime:
 class TestCreateTimer:
     """Tests for create_timer."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass):
         """Test successful creation."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock()
 
-        result = await EntityFactory.create_timer(
+        result = await entity_factory.create_timer(
             mock_hass, "timer.test", "Test", duration="00:05:00"
         )
 
         assert result is True
         mock_hass.services.async_call.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_already_exists(self, mock_hass):
         """Test when already exists."""
         existing_state = MagicMock()
         mock_hass.states.get.return_value = existing_state
 
-        result = await EntityFactory.create_timer(mock_hass, "timer.test", "Test")
+        result = await entity_factory.create_timer(mock_hass, "timer.test", "Test")
 
         assert result is True
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
+        # Second call is answered from the cache
+        mock_hass.states.get.reset_mock()
+        await entity_factory.create_timer(mock_hass, "timer.test", "Test")
+        mock_hass.states.get.assert_not_called()
+
     async def test_exception(self, mock_hass):
         """Test with exception."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock(
             side_effect=Exception("Service error")
         )
 
-        result = await EntityFactory.create_timer(mock_hass, "timer.test", "Test")
+        result = await entity_factory.create_timer(mock_hass, "timer.test", "Test")
 
         assert result is False
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+from homeassistant.core import State
+
 from custom_components.autolock.helpers.entity_validation import (
+    _domain_of,
+    check_available,
+    check_state,
     get_entity_domain,
     validate_entity_available,
     validate_entity_domain,
@@ -33,76 +39,101 @@ def test_validate_entity_domain():
 
     assert validate_entity_domain(hass, "lock.test", "lock") is True
     assert validate_entity_domain(hass, "lock.test", "binary_sensor") is False
+    assert validate_entity_domain(hass, "lock", "lock") is False
 
     # Test when entity doesn't exist
     hass.states.get.return_value = None
     assert validate_entity_domain(hass, "lock.test", "lock") is False
 
+    # Domain mismatch is decided without a state machine lookup
+    hass.states.get.reset_mock()
+    assert validate_entity_domain(hass, "binary_sensor.test", "lock") is False
+    hass.states.get.assert_not_called()
 
-def test_validate_entity_state():
-    """Test validate_entity_state."""
-    hass = MagicMock()
-    state = MagicMock()
-    state.state = "locked"
-    hass.states.get.return_value = state
 
-    assert validate_entity_state(hass, "lock.test", ["locked", "unlocked"]) is True
-    assert validate_entity_state(hass, "lock.test", ["unlocked"]) is False
+@pytest.mark.parametrize(
+    ("current", "valid_states", "expected"),
+    [
+        ("locked", ["locked", "unlocked"], True),
+        ("locked", ["unlocked"], False),
+        ("locked", [], False),
+        ("unlocked", frozenset({"locked", "unlocked"}), True),
+    ],
+)
+def test_validate_entity_state(mock_hass, current, valid_states, expected):
+    """Test validate_entity_state against the state/valid-states matrix."""
+    mock_hass.states.get.return_value = State("lock.test", current)
+
+    assert validate_entity_state(mock_hass, "lock.test", valid_states) is expected
+    # State is looked up once per call
+    mock_hass.states.get.assert_called_once_with("lock.test")
+
+
+@pytest.mark.parametrize(
+    ("current", "expected"),
+    [
+        ("locked", True),
+        ("on", True),
+        ("unavailable", False),
+        ("unknown", False),
+        ("None", False),
+    ],
+)
+def test_validate_entity_available(mock_hass, current, expected):
+    """Test validate_entity_available for available and unavailable states."""
+    mock_hass.states.get.return_value = State("lock.test", current)
+
+    assert validate_entity_available(mock_hass, "lock.test") is expected
+    # State is looked up once per call
+    mock_hass.states.get.assert_called_once_with("lock.test")
+
+
+@pytest.mark.parametrize(
+    "validate",
+    [
+        lambda hass, entity_id: validate_entity_state(hass, entity_id, ["locked"]),
+        validate_entity_available,
+    ],
+    ids=["state", "available"],
+)
+@pytest.mark.parametrize("entity_id", ["lock.test", ""])
+def test_validate_missing_entity(mock_hass, validate, entity_id):
+    """Test state validators with a missing entity or empty entity ID."""
+    assert validate(mock_hass, entity_id) is False
 
-    # Test when entity doesn't exist
-    hass.states.get.return_value = None
-    assert validate_entity_state(hass, "lock.test", ["locked"]) is False
-
-    # Test when entity exists but state becomes None between calls (line 91)
-    # This simulates a race condition where entity exists initially but is removed
-    # First call (in validate_entity_exists) returns a state, second call returns None
-    state_mock = MagicMock()
-    hass.states.get.side_effect = [state_mock, None]
-    assert validate_entity_state(hass, "lock.test", ["locked"]) is False
-    # Reset to use return_value again
-    hass.states.get.side_effect = None
-    hass.states.get.return_value = state
 
-    # Test with empty allowed states
-    hass.states.get.return_value = state
-    assert validate_entity_state(hass, "lock.test", []) is False
+@pytest.mark.slow
+async def test_validators_with_real_state_machine(hass):
+    """Test validators against a real Home Assistant state machine."""
+    hass.states.async_set("lock.front", "locked")
+    hass.states.async_set("binary_sensor.door", "unavailable")
 
+    assert validate_entity_domain(hass, "lock.front", "lock") is True
+    assert validate_entity_state(hass, "lock.front", {"locked"}) is True
+    assert validate_entity_available(hass, "lock.front") is True
+    assert validate_entity_available(hass, "binary_sensor.door") is False
+    assert validate_entity_exists(hass, "lock.back") is False
 
-def test_validate_entity_available():
-    """Test validate_entity_available."""
-    hass = MagicMock()
-    state = MagicMock()
-    state.state = "locked"
-    hass.states.get.return_value = state
 
-    assert validate_entity_available(hass, "lock.test") is True
+@pytest.mark.slow
+async def test_real_state_machine_reset_between_tests(hass):
+    """Test the shared instance starts each test without leftover states."""
+    assert hass.states.get("lock.front") is None
 
-    state.state = "unavailable"
-    assert validate_entity_available(hass, "lock.test") is False
 
-    # Test when entity doesn't exist (line 117)
-    hass.states.get.return_value = None
-    assert validate_entity_available(hass, "lock.test") is False
-
-    # Test when entity exists but state becomes None between calls (line 121)
-    # This simulates a race condition where entity exists initially but is removed
-    # First call (in validate_entity_exists) returns a state, second call returns None
-    state_mock = MagicMock()
-    hass.states.get.side_effect = [state_mock, None]
-    assert validate_entity_available(hass, "lock.test") is False
-    # Reset to use return_value again
-    hass.states.get.side_effect = None
-    hass.states.get.return_value = state
+def test_check_state():
+    """Test state-accepting state check."""
+    assert check_state(State("lock.test", "locked"), {"locked"}) is True
+    assert check_state(State("lock.test", "unlocked"), {"locked"}) is False
+    assert check_state(None, {"locked"}) is False
 
-    # Test with "unknown" state
-    state.state = "unknown"
-    hass.states.get.return_value = state
-    assert validate_entity_available(hass, "lock.test") is False
 
-    # Test with "None" state
-    state.state = "None"
-    hass.states.get.return_value = state
-    assert validate_entity_available(hass, "lock.test") is False
+def test_check_available():
+    """Test state-accepting availability check."""
+    assert check_available(State("lock.test", "locked")) is True
+    assert check_available(State("lock.test", "unavailable")) is False
+    assert check_available(State("lock.test", "unknown")) is False
+    assert check_available(None) is False
 
 
 def test_get_entity_domain():
@@ -114,8 +145,22 @@ def test_get_entity_domain():
     assert get_entity_domain(hass, "lock.test") == "lock"
     assert get_entity_domain(hass, "binary_sensor.door") == "binary_sensor"
     assert get_entity_domain(hass, "invalid") is None
+    # Only the first dot separates the domain, like split(".")[0]
+    assert get_entity_domain(hass, "sensor.a.b") == "sensor"
+    assert get_entity_domain(hass, ".test") == ""
+    assert get_entity_domain(hass, "") is None
 
     # get_entity_domain doesn't check if entity exists, just extracts from entity_id
     # So it will still return the domain even if entity doesn't exist
     hass.states.get.return_value = None
     assert get_entity_domain(hass, "lock.test") == "lock"
+
+
+def test_domain_of_cached():
+    """Test domain extraction is cached per entity ID."""
+    _domain_of.cache_clear()
+    assert _domain_of("lock.front") == "lock"
+    assert _domain_of("lock.front") == "lock"
+    assert _domain_of("invalid") is None
+    info = _domain_of.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
@@ -2,117 +2,96 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
+from homeassistant.const import EVENT_SERVICE_REGISTERED
+from homeassistant.core import Event
 
-from custom_components.autolock.helpers.notifications import NotificationService
+# Registered notify services; find_notify_service only reads it
+NOTIFY_SERVICES = {"mobile_app": {}}
 
+_SERVICE_ERROR = Exception("Service error")
+
+
+async def _raise_service_error(*_args, **_kwargs):
+    """Stand in for a failing hass.services.async_call."""
+    raise _SERVICE_ERROR
 
-@pytest.mark.asyncio
-async def test_send_persistent_notification():
-    """Test send_persistent_notification."""
-    hass = MagicMock()
-    hass.services.async_call = AsyncMock(return_value=None)
 
-    service = NotificationService(hass)
-    result = await service.send_persistent_notification(
+async def test_send_persistent_notification(stub_hass, notification_service):
+    """Test send_persistent_notification."""
+    result = await notification_service.send_persistent_notification(
         "test_id", "Test Title", "Test Message"
     )
 
     assert result is True
-    hass.services.async_call.assert_called_once()
+    stub_hass.services.async_call.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_send_push_notification():
+async def test_send_push_notification(stub_hass, notification_service):
     """Test send_push_notification."""
-    hass = MagicMock()
-    hass.services.async_services.return_value = {"notify": {"mobile_app": {}}}
-    hass.services.async_call = AsyncMock(return_value=None)
+    stub_hass.services.notify = NOTIFY_SERVICES
 
-    service = NotificationService(hass)
-    result = await service.send_push_notification("Title", "Message")
+    result = await notification_service.send_push_notification("Title", "Message")
 
     assert result is True
-    hass.services.async_call.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_find_notify_service():
-    """Test find_notify_service."""
-    hass = MagicMock()
-    hass.services.async_services.return_value = {"notify": {"mobile_app": {}}}
-
-    service = NotificationService(hass)
-    result = service.find_notify_service()
-
-    assert result == "mobile_app"
-
-
-@pytest.mark.asyncio
-async def test_find_notify_service_no_services():
-    """Test find_notify_service when no services available."""
-    hass = MagicMock()
-    hass.services.async_services.return_value = {}
-
-    service = NotificationService(hass)
-    result = service.find_notify_service()
-
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_find_notify_service_with_target():
-    """Test find_notify_service with specific target."""
-    hass = MagicMock()
-    hass.services.async_services.return_value = {
-        "notify": {"notify.mobile_app_iphone": {}, "notify.mobile_app_android": {}}
-    }
-
-    service = NotificationService(hass)
-    result = service.find_notify_service("mobile_app_iphone")
-
-    assert result == "mobile_app_iphone"
-
-
-@pytest.mark.asyncio
-async def test_find_notify_service_with_invalid_target():
-    """Test find_notify_service with invalid target falls back to first service."""
-    hass = MagicMock()
-    hass.services.async_services.return_value = {"notify": {"mobile_app_android": {}}}
-
-    service = NotificationService(hass)
-    result = service.find_notify_service("mobile_app_iphone")
-
-    # Should fall back to first available service
-    assert result == "mobile_app_android"
+    stub_hass.services.async_call.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("services", "target", "expected"),
+    [
+        (NOTIFY_SERVICES, None, "mobile_app"),
+        ({}, None, None),
+        (
+            {"mobile_app_iphone": {}, "mobile_app_android": {}},
+            None,
+            "mobile_app_iphone",
+        ),
+        (
+            {"mobile_app_iphone": {}, "mobile_app_android": {}},
+            "mobile_app_iphone",
+            "mobile_app_iphone",
+        ),
+        ({"mobile_app_android": {}}, "mobile_app_iphone", "mobile_app_android"),
+        ({"other": {}}, "mobile_app_iphone", "other"),
+        ({}, "mobile_app_iphone", None),
+    ],
+    ids=[
+        "first_available",
+        "no_services",
+        "first_of_several",
+        "target_found",
+        "target_missing_falls_back",
+        "target_missing_other_service",
+        "target_missing_no_services",
+    ],
+)
+def test_find_notify_service(
+    stub_hass, services, target, expected, notification_service
+):
+    """Test find_notify_service returns the target or the first service."""
+    stub_hass.services.notify = services
+
+    assert notification_service.find_notify_service(target) == expected
 
 
 class TestSendNotification:
     """Tests for send_notification method."""
 
-    @pytest.mark.asyncio
-    async def test_persistent_only(self, mock_hass):
+    async def test_persistent_only(self, stub_hass, notification_service):
         """Test with persistent only."""
-        mock_hass.services.async_call = AsyncMock(return_value=None)
-
-        service = NotificationService(mock_hass)
-        result = await service.send_notification(
+        result = await notification_service.send_notification(
             "Title", "Message", persistent_id="test_id"
         )
 
         assert result is True
-        mock_hass.services.async_call.assert_called()
+        stub_hass.services.async_call.assert_called()
 
-    @pytest.mark.asyncio
-    async def test_both_persistent_and_push(self, mock_hass):
+    async def test_both_persistent_and_push(self, stub_hass, notification_service):
         """Test with both persistent and push."""
-        mock_hass.services.async_services.return_value = {"notify": {"mobile_app": {}}}
-        mock_hass.services.async_call = AsyncMock(return_value=None)
+        stub_hass.services.notify = NOTIFY_SERVICES
 
-        service = NotificationService(mock_hass)
-        result = await service.send_notification(
+        result = await notification_service.send_notification(
             "Title",
             "Message",
             persistent_id="test_id",
@@ -120,19 +99,17 @@ class TestSendNotification:
         )
 
         assert result is True
-        assert mock_hass.services.async_call.call_count >= 1
+        assert stub_hass.services.async_call.call_count >= 1
 
 
 class TestSendPersistentNotification:
     """Tests for send_persistent_notification method."""
 
-    @pytest.mark.asyncio
-    async def test_failure(self, mock_hass):
+    async def test_failure(self, stub_hass, notification_service):
         """Test with failure."""
-        mock_hass.services.async_call = AsyncMock(side_effect=Exception("Error"))
+        stub_hass.services.async_call = _raise_service_error
 
-        service = NotificationService(mock_hass)
-        result = await service.send_persistent_notification(
+        result = await notification_service.send_persistent_notification(
             "test_id", "Title", "Message"
         )
 
@@ -142,71 +119,76 @@ class TestSendPersistentNotification:
 class TestSendPushNotification:
     """Tests for send_push_notification method."""
 
-    @pytest.mark.asyncio
-    async def test_no_service(self, mock_hass):
+    async def test_no_service(self, notification_service):
         """Test when no service available."""
-        mock_hass.services.async_services.return_value = {}
-
-        service = NotificationService(mock_hass)
-        result = await service.send_push_notification("Title", "Message")
+        result = await notification_service.send_push_notification("Title", "Message")
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_with_data(self, mock_hass):
+    async def test_with_data(self, stub_hass, notification_service):
         """Test with data parameter."""
-        mock_hass.services.async_services.return_value = {"notify": {"mobile_app": {}}}
-        mock_hass.services.async_call = AsyncMock(return_value=None)
+        stub_hass.services.notify = NOTIFY_SERVICES
+        captured = []
+
+        async def capture(*args, **kwargs):
+            captured.append((args, kwargs))
 
-        service = NotificationService(mock_hass)
-        result = await service.send_push_notification(
+        stub_hass.services.async_call = capture
+
+        result = await notification_service.send_push_notification(
             "Title", "Message", data={"key": "value"}
         )
 
         assert result is True
-        call_args = mock_hass.services.async_call.call_args
-        service_data = call_args[0][2]
+        assert len(captured) == 1
+        (domain, service, service_data), _ = captured[0]
+        assert (domain, service) == ("notify", "mobile_app")
         assert service_data.get("key") == "value"
         assert service_data.get("title") == "Title"
         assert service_data.get("message") == "Message"
 
-    @pytest.mark.asyncio
-    async def test_exception(self, mock_hass):
+    async def test_exception(self, stub_hass, notification_service):
         """Test with exception."""
-        mock_hass.services.async_services.return_value = {"notify": {"mobile_app": {}}}
-        mock_hass.services.async_call = AsyncMock(
-            side_effect=Exception("Service error")
-        )
+        stub_hass.services.notify = NOTIFY_SERVICES
+        stub_hass.services.async_call = _raise_service_error
 
-        service = NotificationService(mock_hass)
-        result = await service.send_push_notification("Title", "Message")
+        result = await notification_service.send_push_notification("Title", "Message")
 
         assert result is False
 
 
-class TestFindNotifyService:
-    """Additional tests for find_notify_service."""
+async def test_cached_service(stub_hass, notification_service):
+    """Test first available service is cached until notify services change."""
+    stub_hass.services.notify = NOTIFY_SERVICES
 
-    @pytest.mark.asyncio
-    async def test_target_not_found(self, mock_hass):
-        """Test when target not found."""
-        mock_hass.services.async_services.return_value = {"notify": {"other": {}}}
+    assert notification_service.find_notify_service() == "mobile_app"
+    assert notification_service.find_notify_service() == "mobile_app"
+    assert stub_hass.services.lookups == ["notify"]
+    assert len(stub_hass.bus.listeners) == 2
 
-        service = NotificationService(mock_hass)
-        result = service.find_notify_service("mobile_app_iphone")
+    # Unrelated domain leaves the cache intact
+    notification_service._async_service_changed(
+        Event(EVENT_SERVICE_REGISTERED, {"domain": "light", "service": "turn_on"})
+    )
+    assert notification_service.find_notify_service() == "mobile_app"
+    assert len(stub_hass.services.lookups) == 1
+
+    # Notify service change invalidates the cache
+    stub_hass.services.notify = {"other": {}}
+    notification_service._async_service_changed(
+        Event(EVENT_SERVICE_REGISTERED, {"domain": "notify", "service": "other"})
+    )
+    assert notification_service.find_notify_service() == "other"
+    assert len(stub_hass.bus.listeners) == 2
 
-        # Should return first available
-        assert result == "other"
 
-    @pytest.mark.asyncio
-    async def test_find_notify_service_with_target_found(self, mock_hass):
-        """Test find_notify_service when target is found with notify prefix."""
-        mock_hass.services.async_services.return_value = {
-            "notify": {"notify.mobile_app_iphone": {}, "notify.mobile_app_android": {}}
-        }
+async def test_async_unload(stub_hass, notification_service):
+    """Test unload removes service listeners and clears the cache."""
+    stub_hass.services.notify = NOTIFY_SERVICES
 
-        service = NotificationService(mock_hass)
-        result = service.find_notify_service("mobile_app_iphone")
+    notification_service.find_notify_service()
+    notification_service.async_unload()
 
-        # Should return target (without notify prefix) when found
-        assert result == "mobile_app_iphone"
+    assert stub_hass.bus.listeners == []
+    assert notification_service._cached_notify is None
+    assert notification_service._unsub_service_events == []
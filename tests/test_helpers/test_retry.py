@@ -2,157 +2,130 @@
 
 from __future__ import annotations
 
-import pytest
-
-from custom_components.autolock.helpers.retry import RetryStrategy
-
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
-async def successful_callable():
-    """Successful callable."""
-    return "success"
+import pytest
 
+from custom_components.autolock.helpers.retry import RetryResult, RetryStrategy
 
-async def failing_callable():
-    """Failing callable."""
-    raise ValueError("Test error")
 
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch):
+    """Replace backoff sleeps with an immediate AsyncMock."""
+    sleep = AsyncMock()
+    monkeypatch.setattr("custom_components.autolock.helpers.retry.asyncio.sleep", sleep)
+    return sleep
 
-@pytest.mark.asyncio
-async def test_retry_success():
-    """Test retry with successful call."""
-    strategy = RetryStrategy()
-    result = await strategy.execute_with_retry(
-        successful_callable,
-        max_retries=3,
-        delay=0.1,
-    )
 
-    assert result.success is True
-    assert result.attempts == 1
-    assert result.error is None
-    # Test __str__ for success case (line 32)
-    assert "Success" in str(result)
-    assert "1" in str(result)
+_ERR = ValueError("Test error")
 
 
-@pytest.mark.asyncio
-async def test_retry_failure():
-    """Test retry with failing call."""
-    strategy = RetryStrategy()
-    result = await strategy.execute_with_retry(
-        failing_callable,
-        max_retries=2,
-        delay=0.1,
-    )
+async def _succeed():
+    """Succeed immediately."""
+    return "success"
 
-    assert result.success is False
-    assert result.attempts == 3  # Initial + 2 retries
-    assert result.error is not None
-    assert "Test error" in (result.last_error or "")
 
+async def _fail():
+    """Fail with the shared test error."""
+    # Drop the previous raise's traceback so it doesn't keep growing
+    raise _ERR.with_traceback(None)
 
-@pytest.mark.asyncio
-async def test_retry_no_retries():
-    """Test retry with max_retries=0."""
-    strategy = RetryStrategy()
-    result = await strategy.execute_with_retry(
-        failing_callable,
-        max_retries=0,
-        delay=0.1,
-    )
 
-    assert result.success is False
-    assert result.attempts == 1  # Only initial attempt
-    # Test __str__ for failure case
-    assert "Failed" in str(result)
-    assert "Test error" in str(result)
+def _fail_once():
+    """Build a callable that fails on its first call and then succeeds."""
+    calls = 0
 
-
-@pytest.mark.asyncio
-async def test_retry_with_exponential_backoff():
-    """Test retry with exponential backoff."""
-    strategy = RetryStrategy()
-    call_count = 0
-
-    async def failing_then_success():
-        nonlocal call_count
-        call_count += 1
-        if call_count < 2:
+    async def fail_then_succeed():
+        nonlocal calls
+        calls += 1
+        if calls < 2:
             raise ValueError("Retry")
         return "success"
 
-    result = await strategy.execute_with_retry(
-        failing_then_success,
-        max_retries=2,
-        delay=0.01,
-        exponential_backoff=True,
-    )
-
-    assert result.success is True
-    assert result.attempts == 2
-
-
-@pytest.mark.asyncio
-async def test_retry_with_jitter():
-    """Test retry with jitter."""
-    strategy = RetryStrategy()
-
-    result = await strategy.execute_with_retry(
-        failing_callable,
-        max_retries=1,
-        delay=0.01,
-        jitter=True,
+    return fail_then_succeed
+
+
+# (callable factory, execute_with_retry kwargs, success, attempts)
+RETRY_CASES = (
+    (lambda: _succeed, {"max_retries": 3, "delay": 0}, True, 1),
+    (lambda: _fail, {"max_retries": 2, "delay": 0}, False, 3),
+    (lambda: _fail, {"max_retries": 0, "delay": 0}, False, 1),
+    *(
+        (
+            _fail_once,
+            {"max_retries": 2, "delay": 0.01, "exponential_backoff": exp},
+            True,
+            2,
+        )
+        for exp in (True, False)
+    ),
+    *(
+        (
+            lambda: _fail,
+            {"max_retries": 1, "delay": 0.01, "jitter": jitter},
+            False,
+            2,
+        )
+        for jitter in (True, False)
+    ),
+)
+
+
+async def test_retry_matrix(mock_sleep, retry_strategy):
+    """Test retry outcomes for every scenario, run concurrently."""
+    results = await asyncio.gather(
+        *(
+            retry_strategy.execute_with_retry(factory(), **kwargs)
+            for factory, kwargs, _, _ in RETRY_CASES
+        )
     )
 
-    assert result.success is False
-    assert result.attempts == 2
-
-
-@pytest.mark.asyncio
-async def test_retry_without_exponential_backoff():
-    """Test retry without exponential backoff (line 111)."""
-    strategy = RetryStrategy()
-    call_count = 0
-
-    async def failing_then_success():
-        nonlocal call_count
-        call_count += 1
-        if call_count < 2:
-            raise ValueError("Retry")
-        return "success"
-
-    result = await strategy.execute_with_retry(
-        failing_then_success,
+    for (_, kwargs, success, attempts), result in zip(
+        RETRY_CASES, results, strict=True
+    ):
+        assert (result.success, result.attempts) == (success, attempts), kwargs
+        if success:
+            assert result.error is None
+        else:
+            assert result.last_error == "Test error"
+    # Every failed attempt but the last backs off once
+    assert mock_sleep.await_count == sum(a - 1 for _, _, _, a in RETRY_CASES)
+
+
+async def test_retry_constant_delay_clamped(mock_sleep, retry_strategy):
+    """Test constant delay is clamped to max_delay and not slept after last try."""
+    result = await retry_strategy.execute_with_retry(
+        _fail,
         max_retries=2,
-        delay=0.01,
+        delay=30.0,
         exponential_backoff=False,
+        max_delay=10.0,
+        jitter=False,
     )
 
-    assert result.success is True
-    assert result.attempts == 2
+    assert result.success is False
+    assert result.attempts == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [10.0, 10.0]
 
 
-@pytest.mark.asyncio
-async def test_retry_without_jitter():
-    """Test retry without jitter (line 123)."""
+async def test_retry_jitter_uses_strategy_rng(mock_sleep):
+    """Test jitter is drawn from the strategy's own generator."""
+    # Own instance: this test replaces the generator
     strategy = RetryStrategy()
+    strategy._rng = MagicMock()
+    strategy._rng.uniform.return_value = 0.5
 
-    result = await strategy.execute_with_retry(
-        failing_callable,
-        max_retries=1,
-        delay=0.01,
-        jitter=False,
-    )
+    await strategy.execute_with_retry(_fail, max_retries=1, delay=5.0, jitter=True)
 
-    assert result.success is False
-    assert result.attempts == 2
+    strategy._rng.uniform.assert_called_once_with(-1.0, 1.0)
+    mock_sleep.assert_called_once_with(10.5)
 
 
-@pytest.mark.asyncio
-async def test_retry_result_str_success():
-    """Test RetryResult __str__ for success case."""
-    from custom_components.autolock.helpers.retry import RetryResult
+def test_retry_result_str():
+    """Test RetryResult __str__ for success and failure."""
+    success = RetryResult(success=True, attempts=3)
+    failure = RetryResult(success=False, attempts=1, last_error="Test error")
 
-    result = RetryResult(success=True, attempts=3)
-    assert "Success" in str(result)
-    assert "3" in str(result)
+    assert str(success) == "Success after 3 attempt(s)"
+    assert str(failure) == "Failed after 1 attempt(s): Test error"
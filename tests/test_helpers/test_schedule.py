@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import datetime, time
 
 import pytest
@@ -10,9 +11,14 @@ from custom_components.autolock.helpers.schedule import (
     ScheduleCalculator,
     ScheduleConfig,
     is_time_in_range,
+    is_time_in_range_minutes,
     parse_time_string,
 )
 
+NIGHT_SCHEDULE = ScheduleConfig.from_strings("22:00", "06:00")
+NOON = datetime(2024, 1, 1, 12, 0)
+NIGHT = datetime(2024, 1, 1, 23, 0)
+
 
 def test_parse_time_string():
     """Test parsing time string."""
@@ -26,60 +32,101 @@ def test_parse_time_string():
         parse_time_string("invalid")
 
 
-def test_is_time_in_range_normal():
-    """Test time in range for normal range."""
-    now = datetime(2024, 1, 1, 12, 0)  # Noon
-    start = time(9, 0)
-    end = time(17, 0)
-
-    assert is_time_in_range(now, start, end) is True
-
-    # Before range
-    now = datetime(2024, 1, 1, 8, 0)
-    assert is_time_in_range(now, start, end) is False
-
-    # After range
-    now = datetime(2024, 1, 1, 18, 0)
-    assert is_time_in_range(now, start, end) is False
-
-
-def test_is_time_in_range_midnight_crossing():
-    """Test time in range for midnight crossing."""
-    # Night schedule: 22:00 to 06:00
-    start = time(22, 0)
-    end = time(6, 0)
+@pytest.mark.parametrize(
+    "time_str",
+    ["", ":", "22", "22:", ":30", "24:00", "22:60", "22:00:00", " 2:00", "+2:00"],
+)
+def test_parse_time_string_invalid(time_str):
+    """Test parsing rejects the same inputs as strptime("%H:%M")."""
+    with pytest.raises(ValueError, match="Expected HH:MM"):
+        parse_time_string(time_str)
+
+
+def test_parse_time_string_cached():
+    """Test parsed times are cached per string."""
+    assert parse_time_string("6:05") == time(6, 5)
+    assert parse_time_string("6:05") is parse_time_string("6:05")
+
+
+@pytest.mark.parametrize(
+    ("now", "start", "end", "expected"),
+    [
+        (NOON, time(9, 0), time(17, 0), True),
+        (datetime(2024, 1, 1, 8, 0), time(9, 0), time(17, 0), False),
+        (datetime(2024, 1, 1, 18, 0), time(9, 0), time(17, 0), False),
+        # Midnight crossing: 22:00 to 06:00
+        (NIGHT, time(22, 0), time(6, 0), True),
+        (datetime(2024, 1, 1, 2, 0), time(22, 0), time(6, 0), True),
+        (NOON, time(22, 0), time(6, 0), False),
+    ],
+    ids=[
+        "inside",
+        "before",
+        "after",
+        "night_before_midnight",
+        "night_after_midnight",
+        "day_outside_night",
+    ],
+)
+def test_is_time_in_range(now, start, end, expected):
+    """Test time in range for normal and midnight-crossing ranges."""
+    assert is_time_in_range(now, start, end) is expected
 
-    # During night (before midnight)
-    now = datetime(2024, 1, 1, 23, 0)
-    assert is_time_in_range(now, start, end) is True
 
-    # During night (after midnight)
-    now = datetime(2024, 1, 1, 2, 0)
-    assert is_time_in_range(now, start, end) is True
+def test_schedule_config_minutes():
+    """Test ScheduleConfig precomputes minutes since midnight."""
+    schedule = ScheduleConfig(time(22, 0), time(6, 30))
+    assert schedule.start_minutes == 22 * 60
+    assert schedule.end_minutes == 6 * 60 + 30
+    assert schedule == ScheduleConfig(time(22, 0), time(6, 30))
+    assert hash(schedule) == hash(ScheduleConfig(time(22, 0), time(6, 30)))
 
-    # During day
-    now = datetime(2024, 1, 1, 12, 0)
-    assert is_time_in_range(now, start, end) is False
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        schedule.start_time = time(23, 0)
 
 
-def test_schedule_calculator_get_delay():
+def test_schedule_config_from_strings_cached():
+    """Test identical time strings share one ScheduleConfig instance."""
+    schedule = ScheduleConfig.from_strings("22:00", "06:00")
+    assert ScheduleConfig.from_strings("22:00", "06:00") is schedule
+    assert ScheduleConfig.from_strings("23:00", "06:00") is not schedule
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "hour", "minute", "expected"),
+    [
+        ("09:00", "17:00", 12, 0, True),
+        ("09:00", "17:00", 8, 59, False),
+        ("09:00", "17:00", 17, 0, True),
+        ("09:00", "17:00", 17, 1, False),
+        ("22:00", "06:00", 22, 0, True),
+        ("22:00", "06:00", 2, 0, True),
+        ("22:00", "06:00", 6, 0, True),
+        ("22:00", "06:00", 12, 0, False),
+        ("22:00", "06:00", 21, 59, False),
+    ],
+)
+def test_is_time_in_range_minutes(start, end, hour, minute, expected):
+    """Test minute-resolution range check, including midnight crossing."""
+    schedule = ScheduleConfig.from_strings(start, end)
+    now = datetime(2024, 1, 1, hour, minute, 30)
+    assert is_time_in_range_minutes(now, schedule) is expected
+
+
+@pytest.mark.parametrize(
+    ("now", "schedule", "expected"),
+    [
+        (NOON, NIGHT_SCHEDULE, 5),
+        (NIGHT, NIGHT_SCHEDULE, 2),
+        (NIGHT, None, 5),
+    ],
+    ids=["day", "night", "no_schedule"],
+)
+def test_schedule_calculator_get_delay(now, schedule, expected):
     """Test schedule calculator delay calculation."""
     calculator = ScheduleCalculator()
-
-    # Day time
-    now = datetime(2024, 1, 1, 12, 0)
-    schedule = ScheduleConfig.from_strings("22:00", "06:00")
     delay = calculator.get_delay(now, day_delay=5, night_delay=2, schedule=schedule)
-    assert delay == 5
-
-    # Night time
-    now = datetime(2024, 1, 1, 23, 0)
-    delay = calculator.get_delay(now, day_delay=5, night_delay=2, schedule=schedule)
-    assert delay == 2
-
-    # No schedule
-    delay = calculator.get_delay(now, day_delay=5, night_delay=2, schedule=None)
-    assert delay == 5
+    assert delay == expected
 
 
 def test_schedule_config_from_strings_exception():
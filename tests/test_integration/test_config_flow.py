@@ -2,118 +2,172 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import AbstractContextManager, nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import voluptuous as vol
 
 from custom_components.autolock.config_flow import (
     AutoLockConfigFlow,
     AutoLockOptionsFlowHandler,
 )
 
+# Flow data collected by the end of each step; tests copy them because
+# the flow updates its data in place
+DATA_AFTER_USER = {"name": "Test Door", "lock_entity": "lock.test"}
+DATA_AFTER_TIMING = {
+    **DATA_AFTER_USER,
+    "day_delay": 5,
+    "night_delay": 2,
+    "night_start": "22:00",
+    "night_end": "06:00",
+}
+DATA_AFTER_RETRY = {
+    **DATA_AFTER_TIMING,
+    "retry_count": 3,
+    "retry_delay": 5,
+    "verification_delay": 5,
+}
+
+# Entity states the flow only reads .state from
+LOCKED = SimpleNamespace(state="locked")
+SENSOR_ON = SimpleNamespace(state="on")
+
+# Entity steps are checked both through the real validators reading
+# hass.states and with the validator helper patched out
+ENTITY_VALIDATION = pytest.mark.parametrize("validator", ["states_get", "patch_helper"])
+
+
+def _entity_validation(
+    mock_hass: MagicMock, validator: str, helper: str, state: SimpleNamespace | None
+) -> AbstractContextManager:
+    """Make the entity look like ``state`` (None means missing) to the flow."""
+    if validator == "states_get":
+        mock_hass.states.get.return_value = state
+        return nullcontext()
+    return patch(
+        f"custom_components.autolock.config_flow.{helper}",
+        return_value=state is not None,
+    )
 
-@pytest.fixture
-def flow():
-    """Create config flow instance."""
-    return AutoLockConfigFlow()
 
+def _async_stub():
+    """Build a coroutine function that records its calls on ``.mock``."""
+    mock = Mock(return_value=None)
 
-@pytest.mark.asyncio
-async def test_async_step_user_no_input(flow, mock_hass):
-    """Test user step with no input (initial form)."""
-    flow.hass = mock_hass
+    async def stub(*args, **kwargs):
+        return mock(*args, **kwargs)
 
-    result = await flow.async_step_user(None)
+    stub.mock = mock
+    return stub
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "user"
-    assert "errors" not in result or not result.get("errors")
 
+# Built once and reset by stub_unique_id for each test
+_SET_UNIQUE_ID = _async_stub()
+_ABORT_IF_CONFIGURED = Mock()
 
-@pytest.mark.asyncio
-async def test_async_step_user_invalid_lock(flow, mock_hass):
-    """Test user step with invalid lock entity."""
-    flow.hass = mock_hass
-    # Set up mock to return None (entity not found) so validation fails
-    mock_hass.states.get.return_value = None
 
-    result = await flow.async_step_user({"name": "Test Door", "lock_entity": "invalid"})
+@pytest.fixture(autouse=True)
+def stub_unique_id(monkeypatch):
+    """Stub unique ID handling on the flow class; return the two call mocks."""
+    _SET_UNIQUE_ID.mock.reset_mock()
+    _ABORT_IF_CONFIGURED.reset_mock()
+    # staticmethod keeps the flow instance out of the recorded call
+    monkeypatch.setattr(
+        AutoLockConfigFlow, "async_set_unique_id", staticmethod(_SET_UNIQUE_ID)
+    )
+    monkeypatch.setattr(
+        AutoLockConfigFlow, "_abort_if_unique_id_configured", _ABORT_IF_CONFIGURED
+    )
+    return _SET_UNIQUE_ID.mock, _ABORT_IF_CONFIGURED
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "user"
-    assert "errors" in result
-    assert "lock_entity" in result["errors"]
 
+@pytest.fixture(scope="module")
+def _module_flow():
+    """Create the config flow instance once per test module."""
+    return AutoLockConfigFlow()
 
-@pytest.mark.asyncio
-async def test_async_step_user_valid(flow, mock_hass):
-    """Test user step with valid input."""
-    flow.hass = mock_hass
-    # Set up mock to return a valid lock state
-    lock_state = MagicMock()
-    lock_state.state = "locked"
-    mock_hass.states.get.return_value = lock_state
 
-    result = await flow.async_step_user(
-        {"name": "Test Door", "lock_entity": "lock.test"}
-    )
+@pytest.fixture
+def flow(_module_flow, mock_hass):
+    """Return the shared config flow with fresh data bound to mock_hass."""
+    _module_flow.hass = mock_hass
+    _module_flow.data = {}
+    return _module_flow
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "sensor"
-    assert flow.data["name"] == "Test Door"
-    assert flow.data["lock_entity"] == "lock.test"
 
+async def test_async_step_user_no_input(flow, mock_hass):
+    """Test user step with no input (initial form)."""
+    result = await flow.async_step_user(None)
 
-@pytest.mark.asyncio
-async def test_async_step_sensor_no_input(flow, mock_hass):
-    """Test sensor step with no input (initial form)."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
+    assert "errors" not in result or not result.get("errors")
 
-    result = await flow.async_step_sensor(None)
+
+@ENTITY_VALIDATION
+@pytest.mark.parametrize(
+    ("lock_state", "expected_step", "expected_errors"),
+    [
+        (None, "user", {"lock_entity": "invalid_lock_entity"}),
+        (LOCKED, "sensor", {}),
+    ],
+    ids=["invalid", "valid"],
+)
+async def test_async_step_user(
+    flow, mock_hass, validator, lock_state, expected_step, expected_errors
+):
+    """Test user step advances only for a valid lock entity."""
+    with _entity_validation(mock_hass, validator, "validate_lock_entity", lock_state):
+        result = await flow.async_step_user(DATA_AFTER_USER.copy())
 
     assert result["type"] == "form"
-    assert result["step_id"] == "sensor"
+    assert result["step_id"] == expected_step
+    assert result["errors"] == expected_errors
+    assert flow.data == (DATA_AFTER_USER if lock_state else {})
 
 
-@pytest.mark.asyncio
-async def test_async_step_sensor_invalid(flow, mock_hass):
-    """Test sensor step with invalid sensor."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
-    # Set up mock to return None (entity not found) so validation fails
-    mock_hass.states.get.return_value = None
+async def test_async_step_sensor_no_input(flow, mock_hass):
+    """Test sensor step with no input (initial form)."""
+    flow.data = DATA_AFTER_USER.copy()
 
-    result = await flow.async_step_sensor({"sensor_entity": "invalid"})
+    result = await flow.async_step_sensor(None)
 
     assert result["type"] == "form"
     assert result["step_id"] == "sensor"
-    assert "errors" in result
-    assert "sensor_entity" in result["errors"]
 
 
-@pytest.mark.asyncio
-async def test_async_step_sensor_valid(flow, mock_hass):
-    """Test sensor step with valid input."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
-    # Set up mock to return a valid sensor state
-    sensor_state = MagicMock()
-    sensor_state.state = "on"
-    mock_hass.states.get.return_value = sensor_state
-
-    result = await flow.async_step_sensor({"sensor_entity": "binary_sensor.test"})
+@ENTITY_VALIDATION
+@pytest.mark.parametrize(
+    ("sensor_state", "expected_step", "expected_errors"),
+    [
+        (None, "sensor", {"sensor_entity": "invalid_sensor_entity"}),
+        (SENSOR_ON, "timing", {}),
+    ],
+    ids=["invalid", "valid"],
+)
+async def test_async_step_sensor(
+    flow, mock_hass, validator, sensor_state, expected_step, expected_errors
+):
+    """Test sensor step advances only for a valid sensor entity."""
+    flow.data = DATA_AFTER_USER.copy()
+
+    with _entity_validation(
+        mock_hass, validator, "validate_sensor_entity", sensor_state
+    ):
+        result = await flow.async_step_sensor({"sensor_entity": "binary_sensor.test"})
 
     assert result["type"] == "form"
-    assert result["step_id"] == "timing"
-    assert flow.data["sensor_entity"] == "binary_sensor.test"
+    assert result["step_id"] == expected_step
+    assert result["errors"] == expected_errors
+    assert ("sensor_entity" in flow.data) is (sensor_state is not None)
 
 
-@pytest.mark.asyncio
 async def test_async_step_timing_no_input(flow, mock_hass):
     """Test timing step with no input (initial form)."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
+    flow.data = DATA_AFTER_USER.copy()
 
     result = await flow.async_step_timing(None)
 
@@ -121,62 +175,35 @@ async def test_async_step_timing_no_input(flow, mock_hass):
     assert result["step_id"] == "timing"
 
 
-@pytest.mark.asyncio
-async def test_async_step_timing_invalid_schedule(flow, mock_hass):
-    """Test timing step with invalid schedule."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
+@pytest.mark.parametrize(
+    ("night_start", "expected_step", "expected_errors"),
+    [
+        ("invalid", "timing", {"night_start": "invalid_schedule"}),
+        ("22:00", "retry", {}),
+    ],
+    ids=["invalid", "valid"],
+)
+async def test_async_step_timing(flow, night_start, expected_step, expected_errors):
+    """Test timing step advances only for a valid night schedule."""
+    flow.data = DATA_AFTER_USER.copy()
 
-    # Actually execute validation - invalid time format will fail
     result = await flow.async_step_timing(
         {
             "day_delay": 5,
             "night_delay": 2,
-            "night_start": "invalid",
+            "night_start": night_start,
             "night_end": "06:00",
         }
     )
 
     assert result["type"] == "form"
-    assert result["step_id"] == "timing"
-    assert "errors" in result
-    assert "night_start" in result["errors"]
+    assert result["step_id"] == expected_step
+    assert result["errors"] == expected_errors
 
 
-@pytest.mark.asyncio
-async def test_async_step_timing_valid(flow, mock_hass):
-    """Test timing step with valid input."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
-
-    # Actually execute validation - valid times will pass
-    result = await flow.async_step_timing(
-        {
-            "day_delay": 5,
-            "night_delay": 2,
-            "night_start": "22:00",
-            "night_end": "06:00",
-        }
-    )
-
-    assert result["type"] == "form"
-    assert result["step_id"] == "retry"
-    assert flow.data["day_delay"] == 5
-    assert flow.data["night_delay"] == 2
-
-
-@pytest.mark.asyncio
 async def test_async_step_retry_no_input(flow, mock_hass):
     """Test retry step with no input (initial form)."""
-    flow.hass = mock_hass
-    flow.data = {
-        "name": "Test Door",
-        "lock_entity": "lock.test",
-        "day_delay": 5,
-        "night_delay": 2,
-        "night_start": "22:00",
-        "night_end": "06:00",
-    }
+    flow.data = DATA_AFTER_TIMING.copy()
 
     result = await flow.async_step_retry(None)
 
@@ -184,40 +211,9 @@ async def test_async_step_retry_no_input(flow, mock_hass):
     assert result["step_id"] == "retry"
 
 
-@pytest.mark.asyncio
-async def test_async_step_retry_valid(flow, mock_hass):
-    """Test retry step with valid input."""
-    flow.hass = mock_hass
-    flow.data = {
-        "name": "Test Door",
-        "lock_entity": "lock.test",
-        "day_delay": 5,
-        "night_delay": 2,
-        "night_start": "22:00",
-        "night_end": "06:00",
-    }
-
-    result = await flow.async_step_retry(
-        {"retry_count": 3, "retry_delay": 5, "verification_delay": 5}
-    )
-
-    assert result["type"] == "form"
-    assert result["step_id"] == "options"
-    assert flow.data["retry_count"] == 3
-    assert flow.data["retry_delay"] == 5
-
-
-@pytest.mark.asyncio
 async def test_async_step_options_no_input(flow, mock_hass):
     """Test options step with no input (initial form)."""
-    flow.hass = mock_hass
-    flow.data = {
-        "name": "Test Door",
-        "lock_entity": "lock.test",
-        "retry_count": 3,
-        "retry_delay": 5,
-        "verification_delay": 5,
-    }
+    flow.data = DATA_AFTER_RETRY.copy()
 
     result = await flow.async_step_options(None)
 
@@ -225,42 +221,49 @@ async def test_async_step_options_no_input(flow, mock_hass):
     assert result["step_id"] == "options"
 
 
-@pytest.mark.asyncio
-async def test_async_step_options_complete(flow, mock_hass):
-    """Test options step completing flow."""
-    flow.hass = mock_hass
-    flow.data = {
-        "name": "Test Door",
-        "lock_entity": "lock.test",
-        "retry_count": 3,
-        "retry_delay": 5,
-        "verification_delay": 5,
-    }
+async def test_full_happy_path(flow, mock_hass, stub_unique_id):
+    """Test walking every step on one flow through to entry creation."""
+    mock_hass.states.get.return_value = LOCKED
+    result = await flow.async_step_user(
+        {"name": "Test Door", "lock_entity": "lock.test"}
+    )
+    assert result["step_id"] == "sensor"
 
-    with (
-        patch.object(
-            flow, "async_set_unique_id", new_callable=AsyncMock
-        ) as mock_unique,
-        patch.object(
-            flow, "_abort_if_unique_id_configured", new_callable=MagicMock
-        ) as mock_abort,
-    ):
-        result = await flow.async_step_options({"enable_on_creation": True})
+    mock_hass.states.get.return_value = SENSOR_ON
+    result = await flow.async_step_sensor({"sensor_entity": "binary_sensor.test"})
+    assert result["step_id"] == "timing"
+
+    result = await flow.async_step_timing(
+        {
+            "day_delay": 5,
+            "night_delay": 2,
+            "night_start": "22:00",
+            "night_end": "06:00",
+        }
+    )
+    assert result["step_id"] == "retry"
+
+    result = await flow.async_step_retry(
+        {"retry_count": 3, "retry_delay": 5, "verification_delay": 5}
+    )
+    assert result["step_id"] == "options"
 
-        assert result["type"] == "create_entry"
-        assert result["title"] == "Test Door"
-        assert result["data"]["name"] == "Test Door"
-        mock_unique.assert_called_once()
-        mock_abort.assert_called_once()
+    result = await flow.async_step_options({"enable_on_creation": True})
+    assert result["type"] == "create_entry"
+    assert result["title"] == "Test Door"
+    assert result["data"] == {
+        **DATA_AFTER_RETRY,
+        "sensor_entity": "binary_sensor.test",
+        "enable_on_creation": True,
+    }
+    set_unique_id, abort_if_configured = stub_unique_id
+    set_unique_id.assert_called_once_with("lock.test")
+    abort_if_configured.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_async_get_options_flow(flow, mock_hass):
+def test_async_get_options_flow():
     """Test async_get_options_flow static method."""
-    from homeassistant.config_entries import ConfigEntry
-
-    mock_entry = MagicMock(spec=ConfigEntry)
-    mock_entry.entry_id = "test_entry"
+    mock_entry = SimpleNamespace(entry_id="test_entry", data={})
 
     handler = AutoLockConfigFlow.async_get_options_flow(mock_entry)
 
@@ -268,29 +271,20 @@ async def test_async_get_options_flow(flow, mock_hass):
     assert handler.config_entry == mock_entry
 
 
-@pytest.mark.asyncio
-async def test_options_flow_init():
+def test_options_flow_init():
     """Test AutoLockOptionsFlowHandler initialization."""
-    from homeassistant.config_entries import ConfigEntry
-
-    mock_entry = MagicMock(spec=ConfigEntry)
+    mock_entry = SimpleNamespace(entry_id="test_entry", data={})
     handler = AutoLockOptionsFlowHandler(mock_entry)
 
     assert handler.config_entry == mock_entry
 
 
-@pytest.mark.asyncio
 async def test_options_flow_step_init_no_input(mock_hass):
     """Test options flow init step with no input."""
-    from homeassistant.config_entries import ConfigEntry
-
-    mock_entry = MagicMock(spec=ConfigEntry)
-    mock_entry.data = {
-        "day_delay": 5,
-        "night_delay": 2,
-        "retry_count": 3,
-        "retry_delay": 5,
-    }
+    mock_entry = SimpleNamespace(
+        entry_id="test_entry",
+        data={"day_delay": 5, "night_delay": 2, "retry_count": 3, "retry_delay": 5},
+    )
 
     handler = AutoLockOptionsFlowHandler(mock_entry)
     handler.hass = mock_hass
@@ -300,23 +294,24 @@ async def test_options_flow_step_init_no_input(mock_hass):
     assert result["type"] == "form"
     assert result["step_id"] == "init"
 
+    # Current values are the defaults, ranges are enforced
+    schema = result["data_schema"]
+    assert schema({}) == mock_entry.data
+    with pytest.raises(vol.Invalid):
+        schema({"day_delay": 0})
+
+    # Entries with the same current values share one schema
+    again = await handler.async_step_init(None)
+    assert again["data_schema"] is schema
 
-@pytest.mark.asyncio
-async def test_options_flow_step_init_with_input(mock_hass):
+
+async def test_options_flow_step_init_with_input(mock_hass, mock_config_entry):
     """Test options flow init step with input."""
-    from homeassistant.config_entries import ConfigEntry
-
-    mock_entry = MagicMock(spec=ConfigEntry)
-    mock_entry.data = {
-        "day_delay": 5,
-        "night_delay": 2,
-        "retry_count": 3,
-        "retry_delay": 5,
-    }
-    mock_entry.entry_id = "test_entry"
+    mock_entry = mock_config_entry
 
-    mock_hass.config_entries = MagicMock()
-    mock_hass.config_entries.async_update_entry = AsyncMock()
+    # async_update_entry is a plain callback in Home Assistant, not a coroutine
+    update_entry = Mock(return_value=True)
+    mock_hass.config_entries = SimpleNamespace(async_update_entry=update_entry)
 
     handler = AutoLockOptionsFlowHandler(mock_entry)
     handler.hass = mock_hass
@@ -332,14 +327,35 @@ async def test_options_flow_step_init_with_input(mock_hass):
 
     assert result["type"] == "create_entry"
     assert result["title"] == ""
-    mock_hass.config_entries.async_update_entry.assert_called_once()
+    update_entry.assert_called_once()
+    data = update_entry.call_args.kwargs["data"]
+    assert data == {
+        **mock_entry.data,
+        "day_delay": 10,
+        "night_delay": 3,
+        "retry_count": 2,
+        "retry_delay": 10,
+    }
+
+
+async def test_options_flow_step_init_invalid_stored_data(mock_hass):
+    """Test options flow reports invalid stored entry data instead of saving it."""
+    # Missing required keys
+    mock_entry = SimpleNamespace(entry_id="test_entry", data={"day_delay": 5})
+
+    handler = AutoLockOptionsFlowHandler(mock_entry)
+    handler.hass = mock_hass
+
+    result = await handler.async_step_init({"day_delay": 10})
+
+    assert result["type"] == "form"
+    assert result["errors"] == {"base": "invalid_config"}
+    mock_hass.config_entries.async_update_entry.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_async_step_sensor_no_sensor(flow, mock_hass):
     """Test sensor step with no sensor."""
-    flow.hass = mock_hass
-    flow.data = {"name": "Test Door", "lock_entity": "lock.test"}
+    flow.data = DATA_AFTER_USER.copy()
 
     result = await flow.async_step_sensor({"sensor_entity": ""})
 
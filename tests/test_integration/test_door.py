@@ -2,12 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.util import dt as dt_util
 
 from custom_components.autolock.door import AutolockDoor
+from custom_components.autolock.helpers import entity_factory
+
+
+@pytest.fixture
+def ha_time_zone():
+    """Pin the host clock to UTC and let a test pick HA's time zone."""
+    original_tz = os.environ.get("TZ")
+    original_zone = dt_util.get_default_time_zone()
+    os.environ["TZ"] = "UTC"
+    time.tzset()
+
+    def _set(name: str) -> None:
+        dt_util.set_default_time_zone(dt_util.get_time_zone(name))
+
+    yield _set
+    dt_util.set_default_time_zone(original_zone)
+    if original_tz is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = original_tz
+    time.tzset()
 
 
 @pytest.fixture
@@ -45,23 +69,34 @@ class TestDoorInitialization:
         assert door.retry_strategy is not None
         assert door.notification_service is not None
         assert door.safety_validator is not None
+        assert door.lock_entity == "lock.test"
+        assert door.sensor_entity == "binary_sensor.test"
+        assert door.retry_count == 3
+
+    def test_derived_attributes(self, door):
+        """Test derived entity IDs and schedule are computed once."""
+        assert door.enabled_entity == "input_boolean.autolock_test_door_enabled"
+        assert door.snooze_entity == "input_datetime.autolock_test_door_snooze_until"
+        assert door.timer_entity == "timer.autolock_test_door_delay"
+        assert door.script_entity == "script.autolock_test_door_lock"
+        assert door.automation_entity == "automation.autolock_test_door"
+        assert door.schedule_config is door.schedule_config
 
 
 class TestDoorSetup:
     """Tests for door setup."""
 
-    @pytest.mark.asyncio
     async def test_async_setup(self, door, mock_hass):
         """Test door setup."""
         with (
             patch.object(
-                door.entity_factory, "create_input_boolean", new_callable=AsyncMock
+                entity_factory, "create_input_boolean", new_callable=AsyncMock
             ) as mock_bool,
             patch.object(
-                door.entity_factory, "create_input_datetime", new_callable=AsyncMock
+                entity_factory, "create_input_datetime", new_callable=AsyncMock
             ) as mock_datetime,
             patch.object(
-                door.entity_factory, "create_timer", new_callable=AsyncMock
+                entity_factory, "create_timer", new_callable=AsyncMock
             ) as mock_timer,
             patch.object(door, "_register_listeners") as mock_register,
         ):
@@ -72,18 +107,17 @@ class TestDoorSetup:
             mock_timer.assert_called_once()
             mock_register.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_entities(self, door, mock_hass):
         """Test entity creation."""
         with (
             patch.object(
-                door.entity_factory, "create_input_boolean", new_callable=AsyncMock
+                entity_factory, "create_input_boolean", new_callable=AsyncMock
             ) as mock_bool,
             patch.object(
-                door.entity_factory, "create_input_datetime", new_callable=AsyncMock
+                entity_factory, "create_input_datetime", new_callable=AsyncMock
             ) as mock_datetime,
             patch.object(
-                door.entity_factory, "create_timer", new_callable=AsyncMock
+                entity_factory, "create_timer", new_callable=AsyncMock
             ) as mock_timer,
         ):
             await door._create_entities()
@@ -92,30 +126,65 @@ class TestDoorSetup:
             mock_datetime.assert_called_once()
             mock_timer.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_entities_false_enable(self, door, mock_hass, door_config):
         """Test entity creation with enable_on_creation=False."""
         door.config["enable_on_creation"] = False
 
         with patch.object(
-            door.entity_factory, "create_input_boolean", new_callable=AsyncMock
+            entity_factory, "create_input_boolean", new_callable=AsyncMock
         ) as mock_bool:
             await door._create_entities()
 
             call_args = mock_bool.call_args
             assert call_args[1]["initial_state"] is False
 
-    @pytest.mark.asyncio
     async def test_register_listeners(self, door, mock_hass):
         """Test listener registration."""
         mock_hass.states.get.return_value = MagicMock()
 
-        door._register_listeners()
+        with patch(
+            "custom_components.autolock.door.async_track_state_change_event"
+        ) as mock_track:
+            door._register_listeners()
+
+            mock_track.assert_called_once()
+            assert mock_track.call_args[0][1] == ["binary_sensor.test"]
+
+        assert len(door._listeners) == 2
+        mock_hass.bus.async_listen.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "entity_id,new_state,should_trigger",
+        [
+            ("binary_sensor.test", "on", True),
+            ("binary_sensor.test", "off", False),
+            ("binary_sensor.test", None, False),
+            ("lock.test", "unlocked", True),
+            ("lock.test", "locked", False),
+            ("lock.sensor_lock", "unlocked", True),
+            ("lock.sensor_lock", "on", False),
+        ],
+    )
+    async def test_on_trigger_state(
+        self, door, mock_hass, entity_id, new_state, should_trigger
+    ):
+        """Test trigger listener only fires on the trigger state."""
+        if entity_id.startswith("lock."):
+            door.lock_entity = entity_id
+            door.sensor_entity = None
+
+        with patch("custom_components.autolock.door.async_track_state_change_event"):
+            door._register_listeners()
 
-        assert len(door._listeners) > 0
-        assert mock_hass.bus.async_listen.call_count >= 2
+        state = MagicMock(state=new_state) if new_state else None
+        event = MagicMock()
+        event.data = {"entity_id": entity_id, "new_state": state}
+
+        with patch.object(door, "_handle_trigger", new_callable=MagicMock):
+            door._on_trigger_state(event)
+
+        assert mock_hass.async_create_task.called is should_trigger
 
-    @pytest.mark.asyncio
     async def test_register_listeners_no_entity_id(self, door, mock_hass):
         """Test listener registration with trigger without entity_id."""
         mock_hass.states.get.return_value = MagicMock()
@@ -129,13 +198,13 @@ class TestDoorSetup:
 
             door._register_listeners()
 
-            assert len(door._listeners) > 0
+            assert door._expected == {}
+            assert len(door._listeners) == 1
 
 
 class TestHandleTrigger:
     """Tests for handle_trigger method."""
 
-    @pytest.mark.asyncio
     async def test_disabled(self, door, mock_hass):
         """Test when door is disabled."""
         enabled_state = MagicMock()
@@ -146,17 +215,14 @@ class TestHandleTrigger:
 
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_enabled_state_none(self, door, mock_hass):
         """Test when enabled state is None."""
-        mock_hass.states.get.return_value = None
         mock_hass.services.async_call = AsyncMock()
 
         await door._handle_trigger()
 
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_enabled(self, door, mock_hass):
         """Test when door is enabled."""
         enabled_state = MagicMock()
@@ -178,12 +244,12 @@ class TestHandleTrigger:
 
         assert mock_hass.services.async_call.call_count >= 2  # cancel + start
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "snooze_state_value,should_start_timer",
         [
             ("unknown", True),
             ("unavailable", True),
+            ("", True),
             ("invalid_format", True),  # Invalid format should be handled gracefully
         ],
     )
@@ -211,7 +277,6 @@ class TestHandleTrigger:
         if should_start_timer:
             assert mock_hass.services.async_call.called
 
-    @pytest.mark.asyncio
     async def test_snooze_in_future(self, door, mock_hass):
         """Test when snooze is in the future."""
         enabled_state = MagicMock()
@@ -233,9 +298,43 @@ class TestHandleTrigger:
         mock_hass.services.async_call = AsyncMock()
 
         await door._handle_trigger()
+
         # Should not start timer when snoozed
+        mock_hass.services.async_call.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("time_zone", "offset", "snoozed"),
+        [
+            # HA behind the host: a naive host-local read would see the past
+            ("Pacific/Pago_Pago", timedelta(minutes=30), True),
+            # HA ahead of the host: a naive host-local read would see the future
+            ("Pacific/Kiritimati", timedelta(minutes=-30), False),
+        ],
+    )
+    async def test_snooze_naive_state_uses_ha_time_zone(
+        self, door, mock_hass, ha_time_zone, time_zone, offset, snoozed
+    ):
+        """Test input_datetime's naive local state is read in HA's time zone."""
+        ha_time_zone(time_zone)
+        enabled_state = MagicMock()
+        enabled_state.state = "on"
+        snooze_state = MagicMock()
+        snooze_state.state = (dt_util.now() + offset).strftime("%Y-%m-%d %H:%M:%S")
+
+        def mock_get(entity_id):
+            if "enabled" in entity_id:
+                return enabled_state
+            if "snooze" in entity_id:
+                return snooze_state
+            return None
+
+        mock_hass.states.get.side_effect = mock_get
+        mock_hass.services.async_call = AsyncMock()
+
+        await door._handle_trigger()
+
+        assert mock_hass.services.async_call.called is not snoozed
 
-    @pytest.mark.asyncio
     async def test_snooze_in_past(self, door, mock_hass):
         """Test when snooze is in the past."""
         enabled_state = MagicMock()
@@ -260,7 +359,16 @@ class TestHandleTrigger:
 
         assert mock_hass.services.async_call.called
 
-    @pytest.mark.asyncio
+    def test_parse_snooze_cached(self, door):
+        """Test snooze parsing is reused while the state string is unchanged."""
+        value = "2024-01-01T12:00:00+00:00"
+
+        first = door._parse_snooze(value)
+        second = door._parse_snooze(value)
+
+        assert first is second
+        assert door._parse_snooze("2024-01-02T12:00:00+00:00") != first
+
     async def test_cancels_existing_timer(self, door, mock_hass):
         """Test cancels existing timer before starting new one."""
         enabled_state = MagicMock()
@@ -291,7 +399,6 @@ class TestHandleTrigger:
         assert cancel_called
         assert start_called
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "hour,expected_delay",
         [(12, 5), (23, 2)],  # Day time, Night time
@@ -313,12 +420,9 @@ class TestHandleTrigger:
         mock_hass.states.get.side_effect = mock_get
         mock_hass.services.async_call = AsyncMock()
 
-        # Patch schedule_calculator.get_delay to return expected delay
-        # This avoids patching datetime which is imported inside the function
-        with patch.object(
-            door.schedule_calculator,
-            "get_delay",
-            return_value=expected_delay,
+        with patch(
+            "custom_components.autolock.door.dt_util.now",
+            return_value=datetime(2024, 1, 1, hour, 0),
         ):
             await door._handle_trigger()
 
@@ -332,11 +436,55 @@ class TestHandleTrigger:
                     expected_str = f"00:{expected_delay:02d}:00"
                     assert duration == expected_str
 
+    async def test_direct_timer(self, door, mock_hass):
+        """Test timer is restarted directly on the entity when resolved."""
+        enabled_state = MagicMock()
+        enabled_state.state = "on"
+        mock_hass.states.get.side_effect = lambda entity_id: (
+            enabled_state if "enabled" in entity_id else None
+        )
+        timer = MagicMock()
+        component = MagicMock()
+        component.get_entity.return_value = timer
+        mock_hass.data = {"entity_components": {"timer": component}}
+
+        with patch(
+            "custom_components.autolock.door.dt_util.now",
+            return_value=datetime(2024, 1, 1, 12, 0),
+        ):
+            await door._handle_trigger()
+
+        component.get_entity.assert_called_once_with(door.timer_entity)
+        timer.async_cancel.assert_called_once()
+        timer.async_start.assert_called_once_with(timedelta(minutes=5))
+        mock_hass.services.async_call.assert_not_called()
+
+        # Resolved timer is reused
+        await door._handle_trigger()
+        component.get_entity.assert_called_once()
+
 
 class TestHandleTimerFinished:
     """Tests for handle_timer_finished method."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "entity_id,should_lock",
+        [("timer.autolock_test_door_delay", True), ("timer.other", False)],
+    )
+    def test_timer_finished_listener(self, door, mock_hass, entity_id, should_lock):
+        """Test timer finished listener tracks the lock task for its timer."""
+        door._listen_to_timer_finished()
+        listener = mock_hass.bus.async_listen.call_args[0][1]
+        event = MagicMock()
+        event.data = {"entity_id": entity_id}
+
+        with patch.object(door, "_handle_timer_finished", new_callable=MagicMock):
+            listener(event)
+
+        assert mock_hass.async_create_task.called is should_lock
+        if should_lock:
+            assert door._lock_task is mock_hass.async_create_task.return_value
+
     async def test_calls_lock_door(self, door, mock_hass):
         """Test calls _lock_door."""
         with patch.object(door, "_lock_door", new_callable=AsyncMock) as mock_lock:
@@ -348,7 +496,6 @@ class TestHandleTimerFinished:
 class TestLockDoor:
     """Tests for _lock_door method."""
 
-    @pytest.mark.asyncio
     async def test_success(self, door, mock_hass):
         """Test successful lock."""
         lock_result = MagicMock()
@@ -366,7 +513,6 @@ class TestLockDoor:
 
             door.safety_validator.lock_with_verification.assert_called()
 
-    @pytest.mark.asyncio
     async def test_failure(self, door, mock_hass):
         """Test failed lock."""
         lock_result = MagicMock()
@@ -386,13 +532,14 @@ class TestLockDoor:
                 "send_notification",
                 new_callable=AsyncMock,
             ) as mock_notify,
-            patch("asyncio.sleep", new_callable=AsyncMock),
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=False
+            ),
         ):
             await door._lock_door()
 
             mock_notify.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_success_on_retry(self, door, mock_hass):
         """Test succeeds on second retry attempt."""
         failed_result = MagicMock()
@@ -411,13 +558,14 @@ class TestLockDoor:
                 "lock_with_verification",
                 side_effect=[failed_result, success_result],
             ),
-            patch("asyncio.sleep", new_callable=AsyncMock),
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=False
+            ),
         ):
             await door._lock_door()
 
             assert door.safety_validator.lock_with_verification.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_all_retries_fail(self, door, mock_hass):
         """Test when all retries fail."""
         failed_result = MagicMock()
@@ -436,20 +584,72 @@ class TestLockDoor:
                 "send_notification",
                 new_callable=AsyncMock,
             ) as mock_notify,
-            patch("asyncio.sleep", new_callable=AsyncMock),
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=False
+            ),
         ):
             await door._lock_door()
 
             assert (
                 door.safety_validator.lock_with_verification.call_count
-                == door.config["retry_count"] + 1
+                == door.retry_count + 1
             )
             mock_notify.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_retry_backoff(self, door, mock_hass):
+        """Test retry delay doubles per attempt up to the cap."""
+        door.retry_delay = 20
+        failed_result = MagicMock(success=False, verified=False, error="Lock failed")
+
+        with (
+            patch.object(
+                door.safety_validator,
+                "lock_with_verification",
+                return_value=failed_result,
+            ),
+            patch.object(
+                door.notification_service, "send_notification", new_callable=AsyncMock
+            ),
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=False
+            ) as mock_wait,
+        ):
+            await door._lock_door()
+
+        assert [call[0][0] for call in mock_wait.call_args_list] == [20, 40, 60]
+
+    async def test_unload_aborts_retries(self, door, mock_hass):
+        """Test retries stop without notification when the door unloads."""
+        failed_result = MagicMock(success=False, verified=False, error="Lock failed")
+
+        with (
+            patch.object(
+                door.safety_validator,
+                "lock_with_verification",
+                return_value=failed_result,
+            ) as mock_lock,
+            patch.object(
+                door.notification_service, "send_notification", new_callable=AsyncMock
+            ) as mock_notify,
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=True
+            ),
+        ):
+            await door._lock_door()
+
+        assert mock_lock.call_count == 1
+        mock_notify.assert_not_called()
+
+    async def test_wait_for_unload(self, door):
+        """Test waiting returns on timeout or unload."""
+        assert await door._wait_for_unload(0) is False
+
+        door._unload_event.set()
+        assert await door._wait_for_unload(10) is True
+
     async def test_zero_retries(self, door, mock_hass, door_config):
         """Test with zero retry count."""
-        door.config["retry_count"] = 0
+        door.retry_count = 0
 
         failed_result = MagicMock()
         failed_result.success = False
@@ -473,7 +673,6 @@ class TestLockDoor:
             assert door.safety_validator.lock_with_verification.call_count == 1
             mock_notify.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_no_error_message(self, door, mock_hass):
         """Test when result has no error message."""
         failed_result = MagicMock()
@@ -492,13 +691,14 @@ class TestLockDoor:
                 "send_notification",
                 new_callable=AsyncMock,
             ) as mock_notify,
-            patch("asyncio.sleep", new_callable=AsyncMock),
+            patch.object(
+                door, "_wait_for_unload", new_callable=AsyncMock, return_value=False
+            ),
         ):
             await door._lock_door()
 
             mock_notify.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_verification_delay_configuration(self, door, mock_hass):
         """Test uses configured verification_delay."""
         success_result = MagicMock()
@@ -506,7 +706,7 @@ class TestLockDoor:
         success_result.verified = True
         success_result.error = None
 
-        door.config["verification_delay"] = 7.5
+        door.verification_delay = 7.5
 
         with patch.object(
             door.safety_validator,
@@ -518,10 +718,10 @@ class TestLockDoor:
             call_args = mock_lock.call_args
             assert call_args[1]["verification_delay"] == 7.5
 
-    @pytest.mark.asyncio
-    async def test_default_verification_delay(self, door, mock_hass, door_config):
+    async def test_default_verification_delay(self, mock_hass, door_config):
         """Test uses default verification_delay when not configured."""
-        door.config.pop("verification_delay", None)
+        door_config.pop("verification_delay", None)
+        door = AutolockDoor(mock_hass, "test_door", door_config)
 
         success_result = MagicMock()
         success_result.success = True
@@ -542,7 +742,6 @@ class TestLockDoor:
 class TestUnload:
     """Tests for door unload."""
 
-    @pytest.mark.asyncio
     async def test_async_unload(self, door):
         """Test door unload removes listeners."""
         remove_listener1 = MagicMock()
@@ -554,3 +753,24 @@ class TestUnload:
         remove_listener1.assert_called_once()
         remove_listener2.assert_called_once()
         assert len(door._listeners) == 0
+
+    async def test_async_unload_cancels_lock_task(self, door):
+        """Test door unload cancels an in-flight lock task."""
+        lock_task = MagicMock()
+        lock_task.done.return_value = False
+        door._lock_task = lock_task
+
+        await door.async_unload()
+
+        lock_task.cancel.assert_called_once()
+        assert door._lock_task is None
+
+    async def test_async_unload_finished_lock_task(self, door):
+        """Test door unload leaves a finished lock task alone."""
+        lock_task = MagicMock()
+        lock_task.done.return_value = True
+        door._lock_task = lock_task
+
+        await door.async_unload()
+
+        lock_task.cancel.assert_not_called()
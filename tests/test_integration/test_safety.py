@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -13,7 +14,6 @@ from custom_components.autolock.safety import LockResult, SafetyValidator
 class TestCanLock:
     """Tests for can_lock method."""
 
-    @pytest.mark.asyncio
     async def test_success_with_sensor(self, mock_hass):
         """Test with valid conditions including sensor."""
         lock_state = MagicMock()
@@ -34,7 +34,6 @@ class TestCanLock:
         assert can_lock is True
         assert reason is None
 
-    @pytest.mark.asyncio
     async def test_success_no_sensor(self, mock_hass):
         """Test with valid conditions without sensor."""
         lock_state = MagicMock()
@@ -47,7 +46,6 @@ class TestCanLock:
         assert can_lock is True
         assert reason is None
 
-    @pytest.mark.asyncio
     async def test_already_locked(self, mock_hass):
         """Test when lock is already locked."""
         lock_state = MagicMock()
@@ -60,18 +58,28 @@ class TestCanLock:
         assert can_lock is False
         assert "already locked" in reason.lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("state", ["unavailable", "unknown"])
+    async def test_lock_not_reporting_locked(self, mock_hass, state):
+        """Test a lock in an unknown or unavailable state may still be locked."""
+        lock_state = MagicMock()
+        lock_state.state = state
+        mock_hass.states.get.return_value = lock_state
+
+        validator = SafetyValidator(mock_hass)
+        can_lock, reason = validator.can_lock("lock.test")
+
+        assert can_lock is True
+        assert reason is None
+        mock_hass.states.get.assert_called_once_with("lock.test")
+
     async def test_lock_entity_not_found(self, mock_hass):
         """Test when lock entity doesn't exist."""
-        mock_hass.states.get.return_value = None
-
         validator = SafetyValidator(mock_hass)
         can_lock, reason = validator.can_lock("lock.test")
 
         assert can_lock is False
         assert "not found" in reason.lower()
 
-    @pytest.mark.asyncio
     async def test_door_open(self, mock_hass):
         """Test when door is open."""
         lock_state = MagicMock()
@@ -92,7 +100,6 @@ class TestCanLock:
         assert can_lock is False
         assert "open" in reason.lower()
 
-    @pytest.mark.asyncio
     async def test_sensor_entity_not_found(self, mock_hass):
         """Test when sensor entity doesn't exist."""
         lock_state = MagicMock()
@@ -111,7 +118,6 @@ class TestCanLock:
         assert can_lock is False
         assert "not found" in reason.lower()
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "sensor_state",
         ["off", "unavailable", "unknown", ""],
@@ -136,139 +142,128 @@ class TestCanLock:
         assert can_lock is False
 
 
+TRACK_STATE = "custom_components.autolock.safety.async_track_state_change_event"
+
+
+def _state(value):
+    """Build a mock state object."""
+    state = MagicMock()
+    state.state = value
+    return state
+
+
+def _fire(new_state):
+    """Build a tracker side effect that fires one state change on subscribe."""
+    unsub = MagicMock()
+
+    def _track(hass, entity_ids, action):
+        action(MagicMock(data={"entity_id": entity_ids[0], "new_state": new_state}))
+        return unsub
+
+    return _track, unsub
+
+
 class TestVerifyLockState:
     """Tests for verify_lock_state method."""
 
-    @pytest.mark.asyncio
     async def test_success_immediate(self, mock_hass):
-        """Test succeeds immediately."""
-        lock_state = MagicMock()
-        lock_state.state = LOCK_STATE_LOCKED
-        mock_hass.states.get.return_value = lock_state
+        """Test succeeds immediately without subscribing to state changes."""
+        mock_hass.states.get.return_value = _state(LOCK_STATE_LOCKED)
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        with patch(TRACK_STATE) as mock_track:
             verified, reason = await validator.verify_lock_state(
                 "lock.test", LOCK_STATE_LOCKED, timeout=1.0
             )
 
-            assert verified is True
-            assert reason is None
-
-    @pytest.mark.asyncio
-    async def test_success_after_polling(self, mock_hass):
-        """Test succeeds after polling."""
-        unlocked_state = MagicMock()
-        unlocked_state.state = LOCK_STATE_UNLOCKED
-        locked_state = MagicMock()
-        locked_state.state = LOCK_STATE_LOCKED
-
-        call_count = 0
-
-        def mock_get(entity_id):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return unlocked_state
-            return locked_state
+        assert verified is True
+        assert reason is None
+        mock_track.assert_not_called()
 
-        mock_hass.states.get.side_effect = mock_get
+    async def test_success_after_state_change(self, mock_hass):
+        """Test succeeds once the lock reports the expected state."""
+        mock_hass.states.get.side_effect = [
+            _state(LOCK_STATE_UNLOCKED),
+            _state(LOCK_STATE_LOCKED),
+        ]
+        track, unsub = _fire(_state(LOCK_STATE_LOCKED))
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with patch(TRACK_STATE, side_effect=track) as mock_track:
             verified, reason = await validator.verify_lock_state(
                 "lock.test", LOCK_STATE_LOCKED, timeout=10.0
             )
 
-            assert verified is True
-            assert reason is None
-            assert mock_sleep.call_count >= 1
+        assert verified is True
+        assert reason is None
+        assert mock_track.call_args[0][1] == ["lock.test"]
+        unsub.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_timeout(self, mock_hass):
         """Test times out correctly."""
-        unlocked_state = MagicMock()
-        unlocked_state.state = LOCK_STATE_UNLOCKED
-
-        mock_hass.states.get.return_value = unlocked_state
+        mock_hass.states.get.return_value = _state(LOCK_STATE_UNLOCKED)
+        track, unsub = _fire(_state("locking"))
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        with patch(TRACK_STATE, side_effect=track):
             verified, reason = await validator.verify_lock_state(
-                "lock.test", LOCK_STATE_LOCKED, timeout=0.1
+                "lock.test", LOCK_STATE_LOCKED, timeout=0.01
             )
 
-            assert verified is False
-            assert "timeout" in reason.lower() or "did not reach" in reason.lower()
+        assert verified is False
+        assert "did not reach" in reason.lower()
+        assert "current: unlocked" in reason
+        unsub.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_entity_not_found(self, mock_hass):
         """Test when entity doesn't exist."""
-        mock_hass.states.get.return_value = None
-
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        with patch(TRACK_STATE) as mock_track:
             verified, reason = await validator.verify_lock_state(
                 "lock.test", LOCK_STATE_LOCKED, timeout=1.0
             )
 
-            assert verified is False
-            assert "not found" in reason.lower()
+        assert verified is False
+        assert "not found" in reason.lower()
+        mock_track.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_entity_disappears(self, mock_hass):
-        """Test when entity disappears during polling."""
-        lock_state = MagicMock()
-        lock_state.state = LOCK_STATE_UNLOCKED
-
-        call_count = 0
-
-        def mock_get(entity_id):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return lock_state
-            return None  # Entity disappears
-
-        mock_hass.states.get.side_effect = mock_get
+        """Test when entity is removed while waiting."""
+        mock_hass.states.get.side_effect = [_state(LOCK_STATE_UNLOCKED), None]
+        track, unsub = _fire(None)
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        with patch(TRACK_STATE, side_effect=track):
             verified, reason = await validator.verify_lock_state(
                 "lock.test", LOCK_STATE_LOCKED, timeout=10.0
             )
 
-            assert verified is False
-            assert "not found" in reason.lower()
+        assert verified is False
+        assert "not found" in reason.lower()
+        unsub.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_different_expected_state(self, mock_hass):
         """Test with different expected state."""
-        unlocked_state = MagicMock()
-        unlocked_state.state = LOCK_STATE_UNLOCKED
-
-        mock_hass.states.get.return_value = unlocked_state
+        mock_hass.states.get.return_value = _state(LOCK_STATE_UNLOCKED)
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            verified, reason = await validator.verify_lock_state(
-                "lock.test", LOCK_STATE_UNLOCKED, timeout=0.1
-            )
+        verified, reason = await validator.verify_lock_state(
+            "lock.test", LOCK_STATE_UNLOCKED, timeout=0.1
+        )
 
-            assert verified is True
-            assert reason is None
+        assert verified is True
+        assert reason is None
 
 
 class TestLockWithVerification:
     """Tests for lock_with_verification method."""
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass):
         """Test successful lock with verification."""
         lock_state = MagicMock()
@@ -299,7 +294,6 @@ class TestLockWithVerification:
             assert result.verified is True
             assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_success_with_sensor(self, mock_hass):
         """Test successful lock with sensor entity."""
         lock_state = MagicMock()
@@ -335,11 +329,8 @@ class TestLockWithVerification:
             assert result.success is True
             assert result.verified is True
 
-    @pytest.mark.asyncio
     async def test_pre_check_fails_lock_not_found(self, mock_hass):
         """Test when pre-check fails - lock not found."""
-        mock_hass.states.get.return_value = None
-
         validator = SafetyValidator(mock_hass)
 
         result = await validator.lock_with_verification(
@@ -351,7 +342,6 @@ class TestLockWithVerification:
         assert "not found" in result.error.lower()
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_pre_check_fails_already_locked(self, mock_hass):
         """Test when pre-check fails - already locked."""
         lock_state = MagicMock()
@@ -368,7 +358,6 @@ class TestLockWithVerification:
         assert "already locked" in result.error.lower()
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_pre_check_fails_door_open(self, mock_hass):
         """Test when pre-check fails - door open."""
         lock_state = MagicMock()
@@ -395,7 +384,6 @@ class TestLockWithVerification:
         assert "open" in result.error.lower()
         mock_hass.services.async_call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_service_call_exception(self, mock_hass):
         """Test when service call raises exception."""
         lock_state = MagicMock()
@@ -415,7 +403,6 @@ class TestLockWithVerification:
         assert result.verified is False
         assert "error" in result.error.lower() or "failed" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_verification_timeout(self, mock_hass):
         """Test when verification times out."""
         unlocked_state = MagicMock()
@@ -426,7 +413,15 @@ class TestLockWithVerification:
 
         validator = SafetyValidator(mock_hass)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        def _timeout(awaitable, timeout):
+            awaitable.close()
+            raise TimeoutError
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock),
+            patch(TRACK_STATE),
+            patch("asyncio.wait_for", new=AsyncMock(side_effect=_timeout)),
+        ):
             result = await validator.lock_with_verification(
                 "lock.test", verification_delay=0.1
             )
@@ -438,7 +433,6 @@ class TestLockWithVerification:
                 or "did not reach" in result.error.lower()
             )
 
-    @pytest.mark.asyncio
     async def test_zero_verification_delay(self, mock_hass):
         """Test with zero verification delay."""
         lock_state = MagicMock()
@@ -482,3 +476,9 @@ class TestLockResult:
         assert result.success is False
         assert result.verified is False
         assert result.error == "Test error"
+
+    def test_frozen(self):
+        """Test results are immutable."""
+        result = LockResult(success=True, verified=True)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False
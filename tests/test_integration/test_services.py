@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from contextlib import suppress
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.util import dt as dt_util
 
 from custom_components.autolock.const import (
     DOMAIN,
@@ -13,10 +15,8 @@ from custom_components.autolock.const import (
     SNOOZE_DURATION_30,
     SNOOZE_DURATION_60,
 )
-from custom_components.autolock.services import (
-    _get_door_instance,
-    async_setup_services,
-)
+from custom_components.autolock.door import AutolockRegistry
+from custom_components.autolock.services import async_setup_services
 
 
 async def _get_service_handler(mock_hass, service_name: str):
@@ -28,31 +28,44 @@ async def _get_service_handler(mock_hass, service_name: str):
     return None
 
 
-@pytest.mark.asyncio
 async def test_async_setup_services(mock_hass):
     """Test service setup registers all services."""
     await async_setup_services(mock_hass)
     assert mock_hass.services.async_register.call_count == 4
 
 
-class TestGetDoorInstance:
-    """Tests for _get_door_instance helper."""
+class TestDoorLookup:
+    """Tests for door lookup through the shared registry."""
+
+    async def test_reuses_existing_registry(self, mock_hass):
+        """Test setup keeps the registry created by async_setup."""
+        registry = AutolockRegistry()
+        mock_hass.data[DOMAIN] = registry
+        await async_setup_services(mock_hass)
+        assert mock_hass.data[DOMAIN] is registry
+
+    async def test_creates_registry(self, mock_hass):
+        """Test setup creates the registry when domain data doesn't exist."""
+        mock_hass.data = {}
+        await async_setup_services(mock_hass)
+        assert isinstance(mock_hass.data[DOMAIN], AutolockRegistry)
+
+    async def test_door_added_after_setup(self, mock_hass):
+        """Test doors registered after service setup are found."""
+        mock_hass.services.async_call = AsyncMock()
+        service = await _get_service_handler(mock_hass, "enable")
 
-    def test_door_found(self, mock_hass):
-        """Test when door is found."""
         door = MagicMock()
-        mock_hass.data[DOMAIN] = {"test_door": door}
-        assert _get_door_instance(mock_hass, "test_door") == door
+        door.config = {"name": "Test Door"}
+        mock_hass.data[DOMAIN].doors["test_door"] = door
 
-    def test_door_not_found(self, mock_hass):
-        """Test when door is not found."""
-        mock_hass.data[DOMAIN] = {}
-        assert _get_door_instance(mock_hass, "nonexistent") is None
+        call_data = MagicMock()
+        call_data.data = {"door_id": "test_door"}
+        await service(call_data)
 
-    def test_no_domain_data(self, mock_hass):
-        """Test when domain data doesn't exist."""
-        mock_hass.data = {}
-        assert _get_door_instance(mock_hass, "test_door") is None
+        mock_hass.services.async_call.assert_called_once_with(
+            "input_boolean", "turn_on", {"entity_id": door.enabled_entity}
+        )
 
 
 class TestLockNowService:
@@ -71,20 +84,13 @@ class TestLockNowService:
         door.notification_service.send_notification = AsyncMock()
         return door
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass, door):
         """Test successful lock."""
-        mock_hass.data[DOMAIN] = {"test_door": door}
-
-        with (
-            patch(
-                "custom_components.autolock.services._get_door_instance",
-                return_value=door,
-            ),
-            patch(
-                "custom_components.autolock.services.SafetyValidator"
-            ) as mock_validator,
-        ):
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={"test_door": door})
+
+        with patch(
+            "custom_components.autolock.services.SafetyValidator"
+        ) as mock_validator:
             validator_instance = MagicMock()
             validator_instance.lock_with_verification = AsyncMock(
                 return_value=MagicMock(success=True, verified=True, error=None)
@@ -101,20 +107,13 @@ class TestLockNowService:
             validator_instance.lock_with_verification.assert_called_once()
             door.notification_service.send_notification.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_failure(self, mock_hass, door):
         """Test failed lock."""
-        mock_hass.data[DOMAIN] = {"test_door": door}
-
-        with (
-            patch(
-                "custom_components.autolock.services._get_door_instance",
-                return_value=door,
-            ),
-            patch(
-                "custom_components.autolock.services.SafetyValidator"
-            ) as mock_validator,
-        ):
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={"test_door": door})
+
+        with patch(
+            "custom_components.autolock.services.SafetyValidator"
+        ) as mock_validator:
             validator_instance = MagicMock()
             validator_instance.lock_with_verification = AsyncMock(
                 return_value=MagicMock(
@@ -130,20 +129,13 @@ class TestLockNowService:
 
             door.notification_service.send_notification.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_verification_failed(self, mock_hass, door):
         """Test when verification fails."""
-        mock_hass.data[DOMAIN] = {"test_door": door}
-
-        with (
-            patch(
-                "custom_components.autolock.services._get_door_instance",
-                return_value=door,
-            ),
-            patch(
-                "custom_components.autolock.services.SafetyValidator"
-            ) as mock_validator,
-        ):
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={"test_door": door})
+
+        with patch(
+            "custom_components.autolock.services.SafetyValidator"
+        ) as mock_validator:
             validator_instance = MagicMock()
             validator_instance.lock_with_verification = AsyncMock(
                 return_value=MagicMock(
@@ -159,21 +151,14 @@ class TestLockNowService:
 
             door.notification_service.send_notification.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_with_sensor_entity(self, mock_hass, door):
         """Test with sensor entity."""
         door.config["sensor_entity"] = "binary_sensor.test"
-        mock_hass.data[DOMAIN] = {"test_door": door}
-
-        with (
-            patch(
-                "custom_components.autolock.services._get_door_instance",
-                return_value=door,
-            ),
-            patch(
-                "custom_components.autolock.services.SafetyValidator"
-            ) as mock_validator,
-        ):
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={"test_door": door})
+
+        with patch(
+            "custom_components.autolock.services.SafetyValidator"
+        ) as mock_validator:
             validator_instance = MagicMock()
             validator_instance.lock_with_verification = AsyncMock(
                 return_value=MagicMock(success=True, verified=True, error=None)
@@ -188,7 +173,6 @@ class TestLockNowService:
             call_args = validator_instance.lock_with_verification.call_args
             assert call_args[1]["sensor_entity"] == "binary_sensor.test"
 
-    @pytest.mark.asyncio
     async def test_missing_door_id(self, mock_hass):
         """Test with missing door_id."""
         service = await _get_service_handler(mock_hass, "lock_now")
@@ -197,17 +181,15 @@ class TestLockNowService:
         await service(call_data)
         # Should not raise exception
 
-    @pytest.mark.asyncio
     async def test_door_not_found(self, mock_hass):
         """Test when door is not found."""
-        mock_hass.data[DOMAIN] = {}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={})
         service = await _get_service_handler(mock_hass, "lock_now")
         call_data = MagicMock()
         call_data.data = {"door_id": "nonexistent"}
         await service(call_data)
         # Should not raise exception
 
-    @pytest.mark.asyncio
     async def test_exception_handling(self, mock_hass, door):
         """Test exception handling.
 
@@ -215,17 +197,11 @@ class TestLockNowService:
         and the service doesn't send a notification (exception handling
         would need to be added to the service if desired).
         """
-        mock_hass.data[DOMAIN] = {"test_door": door}
-
-        with (
-            patch(
-                "custom_components.autolock.services._get_door_instance",
-                return_value=door,
-            ),
-            patch(
-                "custom_components.autolock.services.SafetyValidator"
-            ) as mock_validator,
-        ):
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={"test_door": door})
+
+        with patch(
+            "custom_components.autolock.services.SafetyValidator"
+        ) as mock_validator:
             validator_instance = MagicMock()
             validator_instance.lock_with_verification = AsyncMock(
                 side_effect=Exception("Unexpected error")
@@ -250,9 +226,10 @@ class TestSnoozeService:
         """Create mock door."""
         door = MagicMock()
         door.config = {"name": "Test Door"}
+        door.enabled_entity = "input_boolean.autolock_test_door_enabled"
+        door.snooze_entity = "input_datetime.autolock_test_door_snooze_until"
         return door
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "duration",
         [SNOOZE_DURATION_15, SNOOZE_DURATION_30, SNOOZE_DURATION_60],
@@ -260,7 +237,7 @@ class TestSnoozeService:
     async def test_valid_durations(self, mock_hass, door, duration):
         """Test with valid snooze durations."""
         door_id = "test_door"
-        mock_hass.data[DOMAIN] = {door_id: door}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={door_id: door})
         mock_hass.services.async_call = AsyncMock()
 
         service = await _get_service_handler(mock_hass, "snooze")
@@ -272,12 +249,18 @@ class TestSnoozeService:
         call_args = mock_hass.services.async_call.call_args
         assert call_args[0][0] == "input_datetime"
         assert call_args[0][1] == "set_datetime"
+        assert call_args[0][2]["entity_id"] == door.snooze_entity
+        snooze_until = dt_util.parse_datetime(call_args[0][2]["datetime"])
+        assert snooze_until.tzinfo is not None
+        remaining = snooze_until - dt_util.now()
+        assert (
+            timedelta(minutes=duration - 1) < remaining <= timedelta(minutes=duration)
+        )
 
-    @pytest.mark.asyncio
     async def test_default_duration(self, mock_hass, door):
         """Test with default duration."""
         door_id = "test_door"
-        mock_hass.data[DOMAIN] = {door_id: door}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={door_id: door})
         mock_hass.services.async_call = AsyncMock()
 
         service = await _get_service_handler(mock_hass, "snooze")
@@ -287,11 +270,10 @@ class TestSnoozeService:
 
         assert mock_hass.services.async_call.called
 
-    @pytest.mark.asyncio
     async def test_invalid_duration(self, mock_hass, door):
         """Test with invalid duration."""
         door_id = "test_door"
-        mock_hass.data[DOMAIN] = {door_id: door}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={door_id: door})
 
         service = await _get_service_handler(mock_hass, "snooze")
         call_data = MagicMock()
@@ -299,7 +281,6 @@ class TestSnoozeService:
         await service(call_data)
         # Should log error but not crash
 
-    @pytest.mark.asyncio
     async def test_missing_door_id(self, mock_hass):
         """Test with missing door_id."""
         service = await _get_service_handler(mock_hass, "snooze")
@@ -307,10 +288,9 @@ class TestSnoozeService:
         call_data.data = {}
         await service(call_data)
 
-    @pytest.mark.asyncio
     async def test_door_not_found(self, mock_hass):
         """Test when door is not found."""
-        mock_hass.data[DOMAIN] = {}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={})
         service = await _get_service_handler(mock_hass, "snooze")
         call_data = MagicMock()
         call_data.data = {"door_id": "nonexistent", "duration": 30}
@@ -325,13 +305,14 @@ class TestEnableService:
         """Create mock door."""
         door = MagicMock()
         door.config = {"name": "Test Door"}
+        door.enabled_entity = "input_boolean.autolock_test_door_enabled"
+        door.snooze_entity = "input_datetime.autolock_test_door_snooze_until"
         return door
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass, door):
         """Test successful enable."""
         door_id = "test_door"
-        mock_hass.data[DOMAIN] = {door_id: door}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={door_id: door})
         mock_hass.services.async_call = AsyncMock()
 
         service = await _get_service_handler(mock_hass, "enable")
@@ -343,8 +324,8 @@ class TestEnableService:
         call_args = mock_hass.services.async_call.call_args
         assert call_args[0][0] == "input_boolean"
         assert call_args[0][1] == "turn_on"
+        assert call_args[0][2] == {"entity_id": door.enabled_entity}
 
-    @pytest.mark.asyncio
     async def test_missing_door_id(self, mock_hass):
         """Test with missing door_id."""
         service = await _get_service_handler(mock_hass, "enable")
@@ -352,10 +333,9 @@ class TestEnableService:
         call_data.data = {}
         await service(call_data)
 
-    @pytest.mark.asyncio
     async def test_door_not_found(self, mock_hass):
         """Test when door is not found."""
-        mock_hass.data[DOMAIN] = {}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={})
         service = await _get_service_handler(mock_hass, "enable")
         call_data = MagicMock()
         call_data.data = {"door_id": "nonexistent"}
@@ -370,13 +350,14 @@ class TestDisableService:
         """Create mock door."""
         door = MagicMock()
         door.config = {"name": "Test Door"}
+        door.enabled_entity = "input_boolean.autolock_test_door_enabled"
+        door.snooze_entity = "input_datetime.autolock_test_door_snooze_until"
         return door
 
-    @pytest.mark.asyncio
     async def test_success(self, mock_hass, door):
         """Test successful disable."""
         door_id = "test_door"
-        mock_hass.data[DOMAIN] = {door_id: door}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={door_id: door})
         mock_hass.services.async_call = AsyncMock()
 
         service = await _get_service_handler(mock_hass, "disable")
@@ -388,8 +369,8 @@ class TestDisableService:
         call_args = mock_hass.services.async_call.call_args
         assert call_args[0][0] == "input_boolean"
         assert call_args[0][1] == "turn_off"
+        assert call_args[0][2] == {"entity_id": door.enabled_entity}
 
-    @pytest.mark.asyncio
     async def test_missing_door_id(self, mock_hass):
         """Test with missing door_id."""
         service = await _get_service_handler(mock_hass, "disable")
@@ -397,10 +378,9 @@ class TestDisableService:
         call_data.data = {}
         await service(call_data)
 
-    @pytest.mark.asyncio
     async def test_door_not_found(self, mock_hass):
         """Test when door is not found."""
-        mock_hass.data[DOMAIN] = {}
+        mock_hass.data[DOMAIN] = AutolockRegistry(doors={})
         service = await _get_service_handler(mock_hass, "disable")
         call_data = MagicMock()
         call_data.data = {"door_id": "nonexistent"}
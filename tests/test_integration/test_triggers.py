@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from custom_components.autolock.triggers import (
@@ -14,11 +12,15 @@ from custom_components.autolock.triggers import (
 )
 
 
-def test_trigger_strategy_abstract():
-    """Test TriggerStrategy is abstract."""
+def test_trigger_strategy_protocol():
+    """Test TriggerStrategy is a non-instantiable structural protocol."""
     with pytest.raises(TypeError):
         TriggerStrategy()  # Should not be instantiable
 
+    # Concrete strategies satisfy it structurally, without ABC machinery
+    strategy: TriggerStrategy = LockTriggerStrategy("lock.test")
+    assert type(type(strategy)) is type
+
 
 class TestSensorTriggerStrategy:
     """Tests for SensorTriggerStrategy."""
@@ -38,6 +40,20 @@ class TestSensorTriggerStrategy:
         strategy = SensorTriggerStrategy("binary_sensor.test")
         assert strategy.sensor_entity == "binary_sensor.test"
 
+    def test_triggers_built_once(self):
+        """Test triggers are precomputed and instances use slots."""
+        strategy = SensorTriggerStrategy("binary_sensor.test")
+        assert strategy.get_triggers() is strategy.get_triggers()
+        assert not hasattr(strategy, "__dict__")
+
+    def test_trigger_payload_shared_and_read_only(self):
+        """Test strategies for the same entity share one read-only payload."""
+        first = SensorTriggerStrategy("binary_sensor.test").get_triggers()[0]
+        second = SensorTriggerStrategy("binary_sensor.test").get_triggers()[0]
+        assert first is second
+        with pytest.raises(TypeError):
+            first["to"] = "off"
+
 
 class TestLockTriggerStrategy:
     """Tests for LockTriggerStrategy."""
@@ -57,30 +73,49 @@ class TestLockTriggerStrategy:
         strategy = LockTriggerStrategy("lock.test")
         assert strategy.lock_entity == "lock.test"
 
+    def test_triggers_built_once(self):
+        """Test triggers are precomputed and instances use slots."""
+        strategy = LockTriggerStrategy("lock.test")
+        assert strategy.get_triggers() is strategy.get_triggers()
+        assert not hasattr(strategy, "__dict__")
+
+    def test_trigger_payload_shared_and_read_only(self):
+        """Test strategies for the same entity share one read-only payload."""
+        first = LockTriggerStrategy("lock.test").get_triggers()[0]
+        second = LockTriggerStrategy("lock.test").get_triggers()[0]
+        assert first is second
+        with pytest.raises(TypeError):
+            first["to"] = "off"
+
 
 class TestCreateTriggerStrategy:
     """Tests for create_trigger_strategy."""
 
     def test_with_sensor(self):
         """Test returns SensorTriggerStrategy with sensor."""
-        hass = MagicMock()
-        strategy = create_trigger_strategy(hass, "lock.test", "binary_sensor.test")
+        strategy = create_trigger_strategy("lock.test", "binary_sensor.test")
 
         assert isinstance(strategy, SensorTriggerStrategy)
         assert strategy.sensor_entity == "binary_sensor.test"
 
     def test_without_sensor(self):
         """Test returns LockTriggerStrategy when no sensor."""
-        hass = MagicMock()
-        strategy = create_trigger_strategy(hass, "lock.test", None)
+        strategy = create_trigger_strategy("lock.test", None)
 
         assert isinstance(strategy, LockTriggerStrategy)
         assert strategy.lock_entity == "lock.test"
 
     def test_with_empty_sensor(self):
         """Test with empty sensor string."""
-        hass = MagicMock()
-        strategy = create_trigger_strategy(hass, "lock.test", "")
+        strategy = create_trigger_strategy("lock.test", "")
 
         # Empty string should be treated as None
         assert isinstance(strategy, LockTriggerStrategy)
+
+    def test_cached_per_entity_pair(self):
+        """Test one strategy instance is shared per (lock, sensor) pair."""
+        strategy = create_trigger_strategy("lock.test", "binary_sensor.test")
+        assert create_trigger_strategy("lock.test", "binary_sensor.test") is strategy
+        assert create_trigger_strategy("lock.test", "binary_sensor.other") is not (
+            strategy
+        )
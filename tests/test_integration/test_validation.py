@@ -20,12 +20,14 @@ from custom_components.autolock.const import (
     MIN_VERIFICATION_DELAY,
 )
 from custom_components.autolock.validation import (
+    FULL_SCHEMA,
     SCHEMA_BASE,
     SCHEMA_OPTIONS,
     SCHEMA_RETRY,
     SCHEMA_SENSOR,
     SCHEMA_TIMING,
     validate_delay,
+    validate_full_config,
     validate_lock_entity,
     validate_schedule,
     validate_sensor_entity,
@@ -137,7 +139,8 @@ class TestValidateDelay:
     )
     def test_validate_delay(self, min_val, max_val, value, expected):
         """Test validate_delay with various values."""
-        assert validate_delay(min_val, max_val, value) is expected
+        with pytest.deprecated_call():
+            assert validate_delay(min_val, max_val, value) is expected
 
 
 class TestValidateSchedule:
@@ -251,6 +254,11 @@ class TestSchemaTiming:
         assert result["day_delay"] == 5
         assert result["night_delay"] == 2
 
+    def test_extra_key_rejected(self):
+        """Test unknown keys are rejected."""
+        with pytest.raises(vol.Invalid):
+            SCHEMA_TIMING({"night_start": "22:00", "night_end": "06:00", "x": 1})
+
     def test_minimum_values(self):
         """Test with minimum allowed values."""
         data = {
@@ -410,3 +418,38 @@ class TestSchemaOptions:
         """Test with invalid type."""
         with pytest.raises(vol.Invalid):
             SCHEMA_OPTIONS({"enable_on_creation": "true"})
+
+
+class TestFullSchema:
+    """Tests for FULL_SCHEMA / validate_full_config."""
+
+    def test_merges_all_steps(self):
+        """Test the full schema covers every config flow step's keys."""
+        keys = {str(key) for key in FULL_SCHEMA.schema}
+        for schema in (
+            SCHEMA_BASE,
+            SCHEMA_SENSOR,
+            SCHEMA_TIMING,
+            SCHEMA_RETRY,
+            SCHEMA_OPTIONS,
+        ):
+            assert {str(key) for key in schema.schema} <= keys
+
+    def test_valid_with_defaults(self):
+        """Test complete data validates and defaults are applied."""
+        result = validate_full_config(
+            {
+                "name": "Front Door",
+                "lock_entity": "lock.front",
+                "night_start": "22:00",
+                "night_end": "06:00",
+            }
+        )
+        assert result["day_delay"] == 5
+        assert result["retry_count"] == 3
+        assert result["enable_on_creation"] is True
+
+    def test_invalid(self):
+        """Test invalid data raises."""
+        with pytest.raises(vol.Invalid):
+            validate_full_config({"name": "Front Door", "day_delay": 0})